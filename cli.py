@@ -109,7 +109,7 @@ Examples:
         # Convert bytes to hex strings for JSON serialization
         json_packets = []
         for packet in packets:
-            json_packet = packet.copy()
+            json_packet = packet.asdict()
             json_packet['payload'] = packet['payload'].hex()
             json_packets.append(json_packet)
         print(json.dumps(json_packets, indent=2))
@@ -108,7 +108,8 @@ class FakeHuman:
 
     def _generate_fake_ip(self) -> str:
         """Generate a fake but plausible IP address."""
-        return f"{random.randint(1, 254)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        middle = random.getrandbits(16)
+        return f"{random.randint(1, 254)}.{middle >> 8}.{middle & 0xFF}.{random.randint(1, 254)}"
 
 
 class IdentityForge:
@@ -19,7 +19,7 @@ Pick your poison:
 from .sleepy import SleepyMode, BehaviorModel
 from .quadcore import QuadcoreMode
 from .coconut import CoconutMode
-from .personalities import PersonalityMode, PERSONALITIES, list_personalities
+from .personalities import PersonalityMode, PersonalityId, PERSONALITIES, list_personalities
 
 __all__ = [
     'SleepyMode',
@@ -27,6 +27,7 @@ __all__ = [
     'QuadcoreMode',
     'CoconutMode',
     'PersonalityMode',
+    'PersonalityId',
     'PERSONALITIES',
     'list_personalities',
 ]
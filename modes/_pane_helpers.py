@@ -0,0 +1,195 @@
+"""
+Pane helpers for quadcore mode.
+
+The generated pane scripts import this file as a top-level module (with
+modes/ on sys.path), so it sticks to the standard library and never
+pulls in the rest of the modes package.
+"""
+
+import random
+import time
+from array import array
+from itertools import compress
+from math import isqrt
+from typing import Iterator, List, Tuple
+
+
+# Last (epoch second, "HH:MM:SS") pair handed out by clock_stamp
+_stamp_cache = [-1, ""]
+
+
+def clock_stamp() -> str:
+    """
+    Return the wall clock as HH:MM:SS.
+
+    strftime only runs when the second changes; callers printing several
+    times a second get the cached string back.
+    """
+    sec = int(time.time())
+    if sec != _stamp_cache[0]:
+        _stamp_cache[0] = sec
+        _stamp_cache[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _stamp_cache[1]
+
+
+def random_words(rng: random.Random, block: int = 4096) -> Iterator[int]:
+    """
+    Yield random 32-bit words forever, drawn from rng a block at a time.
+
+    One getrandbits(32 * block) call fills the whole block, so a pane
+    making several small draws per frame pays for the generator once
+    every few thousand values instead of on every draw.
+    """
+    while True:
+        yield from array("I", rng.getrandbits(32 * block).to_bytes(4 * block, "little"))
+
+
+# Odd-only wheel for the segmented sieve: WHEEL_PATTERN[j] says whether the
+# odd number 2*j + 1 is coprime to 3, 5 and 7, and repeats every 105 odds.
+WHEEL_PRIMES = (3, 5, 7)
+WHEEL_PERIOD = 3 * 5 * 7
+WHEEL_PATTERN = bytes(
+    int(all((2 * j + 1) % q for q in WHEEL_PRIMES)) for j in range(WHEEL_PERIOD)
+)
+
+
+def small_primes(limit: int) -> List[int]:
+    """
+    Return the odd primes <= limit.
+
+    These are the base primes a segmented sieve strikes with; only
+    primes up to sqrt(high) are ever needed for a segment ending at high.
+    """
+    if limit < 3:
+        return []
+    sieve = bytearray([1]) * (limit + 1)
+    for p in range(3, isqrt(limit) + 1, 2):
+        if sieve[p]:
+            sieve[p * p::2 * p] = bytes(len(range(p * p, limit + 1, 2 * p)))
+    return list(compress(range(3, limit + 1, 2), sieve[3::2]))
+
+
+def _sieve_segment(low: int, high: int, base_primes: List[int]) -> Tuple[int, bytearray]:
+    """
+    Sieve the odd numbers in [low, high).
+
+    Returns (first, sieve) where sieve[i] is 1 iff first + 2*i is prime.
+    2 is never represented; first is the smallest odd number >= max(low, 3).
+    """
+    low = max(low, 3) | 1
+    if low >= high:
+        return low, bytearray()
+
+    # Start from the 3*5*7 wheel instead of all-ones, so the first three
+    # base primes never need striking
+    size = (high - low + 1) // 2
+    offset = (low // 2) % WHEEL_PERIOD
+    repeats = (offset + size) // WHEEL_PERIOD + 1
+    sieve = bytearray((WHEEL_PATTERN * repeats)[offset:offset + size])
+    for q in WHEEL_PRIMES:
+        if low <= q < high:
+            sieve[(q - low) // 2] = 1
+
+    for p in base_primes:
+        if p in WHEEL_PRIMES:
+            continue
+        start = p * p
+        if start >= high:
+            break
+        if start < low:
+            # First odd multiple of p inside the segment
+            start = (low + p - 1) // p * p
+            if not start & 1:
+                start += p
+        idx = (start - low) // 2
+        sieve[idx::p] = bytes(len(range(idx, size, p)))
+
+    return low, sieve
+
+
+def segmented_sieve(low: int, high: int, base_primes: List[int]) -> List[int]:
+    """
+    Find all primes in [low, high) with a segmented Sieve of Eratosthenes.
+
+    The segment holds one byte per odd number and starts from a 3*5*7
+    wheel pattern; multiples of each remaining base prime are struck with
+    a single slice assignment and the survivors are picked out with
+    itertools.compress, so both passes run in C instead of a
+    per-candidate Python loop.
+
+    Args:
+        low: Start of the range (inclusive)
+        high: End of the range (exclusive)
+        base_primes: Ascending odd primes covering at least isqrt(high - 1)
+    """
+    primes = [2] if low <= 2 < high else []
+    first, sieve = _sieve_segment(low, high, base_primes)
+    primes.extend(compress(range(first, high, 2), sieve))
+    return primes
+
+
+def segment_stats(low: int, high: int, base_primes: List[int]) -> Tuple[int, int]:
+    """
+    Count the primes in [low, high) and find the largest one.
+
+    Same sieve as segmented_sieve, but the answer is read straight off
+    the bytearray with count() and rfind(), so no int objects are built
+    for the primes themselves.
+
+    Returns:
+        (count, largest), with largest 0 if the segment holds no primes
+    """
+    has_two = low <= 2 < high
+    first, sieve = _sieve_segment(low, high, base_primes)
+    last = sieve.rfind(1)
+    if last >= 0:
+        return sieve.count(1) + has_two, first + 2 * last
+    return int(has_two), 2 if has_two else 0
+
+
+def extend_base_primes(base_primes: List[int], base_limit: int, limit: int) -> int:
+    """
+    Grow base_primes in place to hold every odd prime <= limit.
+
+    Only the new range (base_limit, limit] is sieved, striking with the
+    primes already held, and the limit at least doubles each time so a
+    steadily rising square root only triggers a regrow now and then.
+
+    Returns:
+        The limit base_primes now covers
+    """
+    if limit <= base_limit:
+        return base_limit
+    limit = max(limit, 2 * base_limit)
+    if base_limit * base_limit < limit:
+        # Held primes don't reach sqrt(limit) yet; start over
+        base_primes[:] = small_primes(limit)
+    else:
+        base_primes.extend(segmented_sieve(base_limit + 1, limit + 1, base_primes))
+    return limit
+
+
+def prime_batches(start: int = 2, batch_size: int = 1000) -> Iterator[Tuple[int, int, int]]:
+    """
+    Sieve consecutive segments forever.
+
+    Yields (high, count, largest) for each segment [low, high), keeping
+    the base primes between segments and only extending them once the
+    segment's square root moves past the current limit.
+    """
+    current = start
+    base_primes: List[int] = []
+    base_limit = 0
+    # Integer square root of the last number sieved, tracked incrementally:
+    # root * root <= high - 1 < (root + 1) * (root + 1)
+    root = isqrt(max(current - 1, 0))
+
+    while True:
+        high = current + batch_size
+        while (root + 1) * (root + 1) < high:
+            root += 1
+        base_limit = extend_base_primes(base_primes, base_limit, root)
+
+        count, largest = segment_stats(current, high, base_primes)
+        yield high, count, largest
+        current = high
@@ -16,8 +16,12 @@ WARNING: Side effects may include:
 
 import asyncio
 import random
+import sys
+from time import monotonic
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Callable
+from enum import IntEnum
+from typing import List, Dict, Optional, Callable, Union
 from datetime import datetime, time
 import math
 
@@ -226,6 +230,25 @@ PERSONALITIES = {
 }
 
 
+class PersonalityId(IntEnum):
+    """Integer ids for PERSONALITIES, in declaration order."""
+    PARANOID = 0
+    DRUNK = 1
+    EXISTENTIAL = 2
+    CORPORATE = 3
+    GAMER = 4
+    BOOMER = 5
+    DOOMSCROLLER = 6
+    CATPERSON = 7
+    CRYPTO_BRO = 8
+    THREE_AM_YOU = 9
+
+
+# Profiles indexed by PersonalityId - integer dispatch instead of string hashing
+PERSONALITIES_TUPLE = tuple(PERSONALITIES.values())
+_NAME_TO_ID = {name: PersonalityId(i) for i, name in enumerate(PERSONALITIES)}
+
+
 # Site lists for each category
 PERSONALITY_SITES = {
     # Paranoid
@@ -501,15 +524,29 @@ class PersonalityMode:
 
     def __init__(
         self,
-        personality: str = "paranoid",
+        personality: Union[str, PersonalityId] = "paranoid",
         fetch_callback: Optional[Callable] = None,
+        seed: Optional[int] = None,
+        quiet: bool = False,
     ):
-        if personality not in PERSONALITIES:
+        if isinstance(personality, PersonalityId):
+            pid = personality
+        elif personality in _NAME_TO_ID:
+            pid = _NAME_TO_ID[personality]
+        else:
             available = ", ".join(PERSONALITIES.keys())
             raise ValueError(f"Unknown personality: {personality}. Available: {available}")
 
-        self.profile = PERSONALITIES[personality]
+        self.pid: int = pid
+        self.profile = PERSONALITIES_TUPLE[pid]
         self.fetch_callback = fetch_callback
+        # Per-agent RNG: no shared global state between personalities,
+        # and a seed makes a run reproducible.
+        self._rand = random.Random(seed)
+        self.quiet = quiet
+        # Ring buffer of (timestamp, message) records, flushed in batches
+        # by a background task instead of printing from the hot loop.
+        self._log: deque = deque(maxlen=4096)
         self.running = False
         self.stats = {
             "requests": 0,
@@ -527,10 +564,10 @@ class PersonalityMode:
         min_delay, max_delay = delays.get(self.profile.attention_span, (10, 60))
 
         # Add chaos factor
-        if random.random() < self.profile.chaos_level:
+        if self._rand.random() < self.profile.chaos_level:
             max_delay *= 2
 
-        return random.uniform(min_delay, max_delay)
+        return self._rand.uniform(min_delay, max_delay)
 
     def _is_active_hour(self) -> bool:
         """Check if current hour is within active hours."""
@@ -548,12 +585,37 @@ class PersonalityMode:
         categories = list(self.profile.site_categories.keys())
         weights = list(self.profile.site_categories.values())
 
-        selected_category = random.choices(categories, weights=weights, k=1)[0]
+        selected_category = self._rand.choices(categories, weights=weights, k=1)[0]
 
         # Get sites for category
         sites = PERSONALITY_SITES.get(selected_category, ["https://www.google.com"])
 
-        return random.choice(sites)
+        return self._rand.choice(sites)
+
+    def _emit(self, msg: str) -> None:
+        """Queue a log line for the flusher (dropped in quiet mode)."""
+        if not self.quiet:
+            self._log.append((monotonic(), msg))
+
+    def _flush_log(self) -> None:
+        """Write all queued log lines in a single batch."""
+        if not self._log:
+            return
+        lines = []
+        while self._log:
+            lines.append(self._log.popleft()[1])
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    async def _flusher(self, interval: float = 1.0) -> None:
+        """Periodically drain the log buffer to stdout."""
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                self._flush_log()
+        except asyncio.CancelledError:
+            self._flush_log()
+            raise
 
     async def run(self, duration_minutes: int = 60) -> None:
         """Run the personality mode."""
@@ -567,19 +629,20 @@ class PersonalityMode:
         print(f"{'=' * 60}\n")
 
         end_time = datetime.now().timestamp() + (duration_minutes * 60)
+        flusher = None if self.quiet else asyncio.create_task(self._flusher())
 
         while self.running and datetime.now().timestamp() < end_time:
             try:
                 # Check if we should be active
                 if not self._is_active_hour():
-                    print(f"[{self.profile.name}] Not active hours. Waiting...")
+                    self._emit(f"[{self.profile.name}] Not active hours. Waiting...")
                     await asyncio.sleep(300)  # Check again in 5 min
                     continue
 
                 # Select and visit site
                 site = self._select_site()
-                print(f"[{self.profile.name}] {self.profile.catchphrase}")
-                print(f"[{self.profile.name}] Visiting: {site}")
+                self._emit(f"[{self.profile.name}] {self.profile.catchphrase}")
+                self._emit(f"[{self.profile.name}] Visiting: {site}")
 
                 if self.fetch_callback:
                     await self.fetch_callback(site)
@@ -588,15 +651,23 @@ class PersonalityMode:
 
                 # Delay based on personality
                 delay = self._get_delay()
-                print(f"[{self.profile.name}] Next request in {delay:.0f}s")
+                self._emit(f"[{self.profile.name}] Next request in {delay:.0f}s")
                 await asyncio.sleep(delay)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"[{self.profile.name}] Error: {e}")
+                self._emit(f"[{self.profile.name}] Error: {e}")
                 await asyncio.sleep(30)
 
+        if flusher:
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        self._flush_log()
+
         self.running = False
         self._print_stats()
 
@@ -634,8 +705,6 @@ def list_personalities() -> None:
 
 # For testing
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1 and sys.argv[1] == "--list":
         list_personalities()
     else:
@@ -16,16 +16,32 @@ Falls back to background processes if neither is available.
 """
 
 import asyncio
+import hashlib
+import py_compile
 import subprocess
+import shlex
 import shutil
+import signal
 import sys
 import os
 import random
-import math
+import tempfile
 import time
 from dataclasses import dataclass
-from typing import Optional, List, Callable
-from datetime import datetime
+from typing import Optional, List, Dict, Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import isqrt
+
+try:
+    from ._pane_helpers import (
+        clock_stamp, segment_stats, extend_base_primes,
+    )
+except ImportError:
+    # Run directly as a script, with modes/ itself on sys.path
+    from _pane_helpers import (
+        clock_stamp, segment_stats, extend_base_primes,
+    )
 
 
 @dataclass
@@ -34,6 +50,7 @@ class PaneConfig:
     name: str
     command: str
     description: str
+    script: Optional[str] = None  # Generated pane script it runs, if any
 
 
 class QuadcoreMode:
@@ -49,16 +66,30 @@ class QuadcoreMode:
     - System Metrics: Fake but impressive stats
     """
 
-    # ASCII art for the prime theater
+    # ASCII art for each pane, spliced into the scripts as literals
     PRIME_BANNER = r"""
     ╔═══════════════════════════════════════╗
     ║     PRIME NUMBER DISCOVERY ENGINE     ║
     ║   "Finding primes since just now"     ║
     ╚═══════════════════════════════════════╝
-    """
+"""
+
+    PACKET_BANNER = r"""
+    ╔═══════════════════════════════════════╗
+    ║       PACKET SIMULATION ENGINE        ║
+    ║     "Packets go brrrrr (safely)"      ║
+    ╚═══════════════════════════════════════╝
+"""
+
+    HACKER_BANNER = r"""
+    ╔═══════════════════════════════════════╗
+    ║        SYSTEM OPERATIONS CENTER       ║
+    ║       "We're in the mainframe"        ║
+    ╚═══════════════════════════════════════╝
+"""
 
     # Hacker movie style phrases
-    HACKER_PHRASES = [
+    HACKER_PHRASES = (
         "Bypassing mainframe encryption...",
         "Downloading more RAM...",
         "Reversing the polarity...",
@@ -79,7 +110,22 @@ class QuadcoreMode:
         "Moving fast and breaking things...",
         "Putting it on the blockchain...",
         "Making it webscale...",
-    ]
+    )
+
+    # Hacker movie "discoveries": (%-template, low, high) - the number is
+    # drawn from [low, high] only for templates that take one
+    HACKER_DISCOVERIES = (
+        ("Found %d open ports", 1, 100),
+        ("Detected %d active services", 1, 50),
+        ("Vulnerability scan complete", 0, 0),
+        ("Downloaded %d packets", 100, 9999),
+        ("Encryption key extracted", 0, 0),
+        ("Firewall bypassed successfully", 0, 0),
+        ("Access granted to level %d", 1, 10),
+    )
+
+    # Panes run as threads of the shared pane worker under tmux
+    SHARED_PANES = ("packet_sim", "hacker_mode")
 
     def __init__(
         self,
@@ -96,8 +142,15 @@ class QuadcoreMode:
         # Find the script directory
         self.script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.traffic_noise_path = traffic_noise_path or os.path.join(self.script_dir, "traffic_noise.py")
+        # Panes import _pane_helpers from here as a top-level module
+        self.helpers_dir = os.path.dirname(os.path.abspath(__file__))
         self.use_nice = use_nice
 
+        # Where the generated pane scripts are written
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.cache_dir = os.path.join(cache_home, "palm-tree")
+        self._script_paths: Optional[Dict[str, str]] = None
+
         # Check available terminal multiplexers
         self.has_tmux = shutil.which("tmux") is not None
         self.has_screen = shutil.which("screen") is not None
@@ -105,16 +158,73 @@ class QuadcoreMode:
         self.processes: List[subprocess.Popen] = []
         self.running = False
 
-    def _get_pane_configs(self) -> List[PaneConfig]:
-        """Get the configuration for all 4 panes."""
+    def _ensure_scripts(self) -> Dict[str, str]:
+        """
+        Write the generated pane scripts to the cache dir, precompiled.
+
+        Each file is named after a hash of its contents, so an unchanged
+        script is reused across launches and a changed one never
+        overwrites a file a running pane is reading. Next to each .py a
+        .pyc is compiled once per interpreter version; the panes run that
+        directly and skip parsing and compiling on every start.
+
+        The sources are only built and hashed on the first call; later
+        calls return the same mapping.
+
+        Returns:
+            Mapping of script name to its compiled script on disk
+        """
+        if self._script_paths is not None:
+            return self._script_paths
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        paths = {}
+        for name, source in (
+            ("prime_theater", self._get_prime_script()),
+            ("packet_sim", self._get_packet_script()),
+            ("hacker_mode", self._get_hacker_script()),
+            ("pane_worker", self._get_worker_script()),
+        ):
+            digest = hashlib.sha256(source.encode()).hexdigest()[:12]
+            path = os.path.join(self.cache_dir, f"{name}-{digest}.py")
+            if not os.path.exists(path):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(source)
+                os.replace(tmp_path, path)
+
+            pyc_path = f"{path[:-3]}.{sys.implementation.cache_tag}.pyc"
+            if not os.path.exists(pyc_path):
+                py_compile.compile(path, cfile=pyc_path, doraise=True)
+            paths[name] = pyc_path
+
+        self._script_paths = paths
+        return paths
+
+    def _get_pane_configs(self, fifo_dir: Optional[str] = None) -> List[PaneConfig]:
+        """
+        Get the configuration for all 4 panes.
+
+        Args:
+            fifo_dir: If set, the SHARED_PANES only cat their FIFO in this
+                directory and the pane worker does the actual work
+        """
         python = sys.executable
         nice_prefix = "nice -n 19 " if self.use_nice else ""
+        scripts = self._ensure_scripts()
+
+        def shared(name: str) -> str:
+            if fifo_dir:
+                return f"cat {shlex.quote(os.path.join(fifo_dir, name))}"
+            return f"{nice_prefix}{python} {shlex.quote(scripts[name])}"
 
         return [
             PaneConfig(
                 name="Prime Theater",
-                command=f"{nice_prefix}{python} -c \"{self._get_prime_script()}\"",
-                description="Prime number calculation (CPU theater)"
+                command=f"{nice_prefix}{python} {shlex.quote(scripts['prime_theater'])}",
+                description="Prime number calculation (CPU theater)",
+                script="prime_theater",
             ),
             PaneConfig(
                 name="Traffic Noise",
@@ -123,203 +233,367 @@ class QuadcoreMode:
             ),
             PaneConfig(
                 name="Packet Sim",
-                command=f"{nice_prefix}{python} -c \"{self._get_packet_script()}\"",
-                description="Random packet simulation display"
+                command=shared("packet_sim"),
+                description="Random packet simulation display",
+                script="packet_sim",
             ),
             PaneConfig(
                 name="Hacker Mode",
-                command=f"{nice_prefix}{python} -c \"{self._get_hacker_script()}\"",
-                description="Fake system metrics & hacker movie output"
+                command=shared("hacker_mode"),
+                description="Fake system metrics & hacker movie output",
+                script="hacker_mode",
             ),
         ]
 
     def _get_prime_script(self) -> str:
-        """Return the prime theater script as a string."""
-        return '''
+        """
+        Return the prime theater script as a string.
+
+        The sieve itself is imported from _pane_helpers rather than inlined,
+        so the child runs the same code as prime_theater_standalone and
+        loads it from the cached bytecode in __pycache__. The helpers are
+        imported as a top-level module, so the modes package is never loaded.
+        """
+        return f"HELPERS_DIR = {self.helpers_dir!r}\nBANNER = {self.PRIME_BANNER!r}\n" + '''
+import os
 import time
 import random
 import sys
 
-def is_prime(n):
-    if n < 2: return False
-    if n == 2: return True
-    if n % 2 == 0: return False
-    for i in range(3, int(n**0.5) + 1, 2):
-        if n % i == 0: return False
-    return True
-
-def sieve_segment(start, end):
-    """Find primes in a range using trial division."""
-    primes = []
-    for n in range(start, end):
-        if is_prime(n):
-            primes.append(n)
-    return primes
-
-print(chr(27) + "[2J")  # Clear screen
-print("""
-    ╔═══════════════════════════════════════╗
-    ║     PRIME NUMBER DISCOVERY ENGINE     ║
-    ║   \\"Finding primes since just now\\"    ║
-    ╚═══════════════════════════════════════╝
-""")
+sys.path.insert(0, HELPERS_DIR)
+from _pane_helpers import clock_stamp, prime_batches
+
+def emit(lines):
+    """Write a whole frame with a single syscall."""
+    os.write(1, ("\\n".join(lines) + "\\n").encode())
+
+emit([chr(27) + "[2J", BANNER])  # Clear screen
 
 primes_found = 0
-current = 2
-batch_size = 1000
+batches = prime_batches(batch_size=1000)
 
 while True:
     try:
-        primes = sieve_segment(current, current + batch_size)
-        primes_found += len(primes)
-        current += batch_size
-
-        if primes:
-            largest = primes[-1]
-            print(f"[{time.strftime(\\"%H:%M:%S\\")}] Scanned up to {current:,}")
-            print(f"  Found {len(primes)} primes in this batch")
-            print(f"  Largest: {largest:,}")
-            print(f"  Total primes found: {primes_found:,}")
-            print()
+        current, count, largest = next(batches)
+        primes_found += count
+
+        if count:
+            emit([
+                f"[{clock_stamp()}] Scanned up to {current:,}",
+                f"  Found {count} primes in this batch",
+                f"  Largest: {largest:,}",
+                f"  Total primes found: {primes_found:,}",
+                "",
+            ])
 
         # Slow down to be nice
         time.sleep(random.uniform(1, 3))
 
     except KeyboardInterrupt:
-        print(f"\\nTotal primes discovered: {primes_found:,}")
+        emit([f"\\nTotal primes discovered: {primes_found:,}"])
         break
 '''
 
     def _get_packet_script(self) -> str:
         """Return the packet simulation script."""
-        return '''
+        return f"HELPERS_DIR = {self.helpers_dir!r}\nBANNER = {self.PACKET_BANNER!r}\n" + '''
+import os
 import time
 import random
 import sys
 
-protocols = ["TCP", "UDP", "ICMP"]
-flags = ["SYN", "ACK", "FIN", "PSH", "RST", "SYN-ACK"]
+sys.path.insert(0, HELPERS_DIR)
+from _pane_helpers import clock_stamp, random_words
+
+protocols = ("TCP", "UDP", "ICMP")
+flags = ("SYN", "ACK", "FIN", "PSH", "RST", "SYN-ACK")
+
+# One private generator; small draws come from a pool of 32-bit words
+# refilled a block at a time, and the modulo bias is irrelevant for a display
+_r = random.Random()
+_w = random_words(_r).__next__
 
 def random_ip():
-    return f"{random.randint(1,254)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}"
+    b = _w()
+    return f"{(b & 0xFF) % 254 + 1}.{(b >> 8) & 0xFF}.{(b >> 16) & 0xFF}.{(b >> 24) % 254 + 1}"
 
 def random_port():
-    return random.randint(1024, 65535)
+    return 1024 + _w() % 64512
 
-print(chr(27) + "[2J")  # Clear screen
-print("""
-    ╔═══════════════════════════════════════╗
-    ║       PACKET SIMULATION ENGINE        ║
-    ║     "Packets go brrrrr (safely)"      ║
-    ╚═══════════════════════════════════════╝
-""")
+# The pane worker hands us a FIFO fd; run directly we own the terminal
+OUT = globals().get("PANE_FD", 1)
+# Under the pane worker only its main thread sees Ctrl-C; it sets PANE_STOP
+STOP = globals().get("PANE_STOP")
+
+def pause(seconds):
+    """Sleep, returning True early once the pane worker is stopping."""
+    return STOP.wait(seconds) if STOP else time.sleep(seconds)
+
+def emit(lines):
+    """Write a whole frame with a single syscall."""
+    os.write(OUT, ("\\n".join(lines) + "\\n").encode())
+
+emit([chr(27) + "[2J", BANNER])  # Clear screen
 
 packet_count = 0
 
 while True:
     try:
-        protocol = random.choice(protocols)
+        protocol = protocols[_w() % 3]
         src_ip = random_ip()
         dst_ip = random_ip()
 
-        print(f"[{time.strftime(\\"%H:%M:%S\\")}] Packet #{packet_count + 1}")
-        print(f"  Protocol: {protocol}")
-        print(f"  {src_ip} -> {dst_ip}")
+        frame = [
+            f"[{clock_stamp()}] Packet #{packet_count + 1}",
+            f"  Protocol: {protocol}",
+            f"  {src_ip} -> {dst_ip}",
+        ]
 
         if protocol == "TCP":
-            print(f"  Ports: {random_port()} -> {random_port()}")
-            print(f"  Flags: {random.choice(flags)}")
-            print(f"  Seq: {random.randint(0, 2**32-1)}")
+            frame.append(f"  Ports: {random_port()} -> {random_port()}")
+            frame.append(f"  Flags: {flags[_w() % 6]}")
+            frame.append(f"  Seq: {_w()}")
         elif protocol == "UDP":
-            print(f"  Ports: {random_port()} -> {random_port()}")
+            frame.append(f"  Ports: {random_port()} -> {random_port()}")
         else:
-            print(f"  Type: {'Echo Request' if random.randint(0,1) else 'Echo Reply'}")
+            frame.append(f"  Type: {'Echo Request' if _w() & 1 else 'Echo Reply'}")
 
-        print(f"  Payload: {random.randint(0, 1500)} bytes")
-        print()
+        frame.append(f"  Payload: {_w() % 1501} bytes")
+        frame.append("")
+        emit(frame)
 
         packet_count += 1
-        time.sleep(random.uniform(0.5, 2))
+        if pause(_r.uniform(0.5, 2)):
+            break
 
     except KeyboardInterrupt:
-        print(f"\\nTotal packets simulated: {packet_count}")
         break
+
+emit([f"\\nTotal packets simulated: {packet_count}"])
 '''
 
     def _get_hacker_script(self) -> str:
         """Return the hacker movie script."""
-        phrases = self.HACKER_PHRASES
         return f'''
+import os
 import time
 import random
 import sys
+from itertools import cycle
+
+sys.path.insert(0, {self.helpers_dir!r})
+from _pane_helpers import clock_stamp, random_words
+
+BANNER = {self.HACKER_BANNER!r}
+phrases = {self.HACKER_PHRASES!r}
+discoveries = {self.HACKER_DISCOVERIES!r}
+
+# One private generator; small draws come from a pool of 32-bit words
+# refilled a block at a time, and the modulo bias is irrelevant for a display
+_r = random.Random()
+_rb = _r.getrandbits
+_w = random_words(_r).__next__
+
+# Shuffle the phrases once and deal them out in order
+phrase_cycle = cycle(_r.sample(phrases, len(phrases)))
 
-phrases = {phrases}
+# The pane worker hands us a FIFO fd; run directly we own the terminal
+OUT = globals().get("PANE_FD", 1)
+# Under the pane worker only its main thread sees Ctrl-C; it sets PANE_STOP
+STOP = globals().get("PANE_STOP")
+
+def pause(seconds):
+    """Sleep, returning True early once the pane worker is stopping."""
+    return STOP.wait(seconds) if STOP else time.sleep(seconds)
+
+def emit(lines):
+    """Write a whole frame with a single syscall."""
+    os.write(OUT, ("\\n".join(lines) + "\\n").encode())
 
 def fake_progress():
-    """Print a fake progress bar."""
-    total = random.randint(20, 50)
+    """Print a fake progress bar, one write per frame."""
+    total = 20 + _w() % 31
+    # "\\r  [" + bar + "] ", updated in place: each tick only moves the arrow
+    frame = bytearray(b"\\r  [" + b" " * total + b"] ")
     for i in range(total):
-        progress = "=" * i + ">" + " " * (total - i - 1)
-        percent = int((i / total) * 100)
-        print(f"\\r  [{progress}] {percent}%", end="", flush=True)
-        time.sleep(random.uniform(0.05, 0.2))
-    print(f"\\r  [{'=' * total}] 100%")
+        if i:
+            frame[3 + i] = 0x3D  # "="
+        frame[4 + i] = 0x3E  # ">"
+        os.write(OUT, frame + b"%d%%" % (i * 100 // total))
+        if pause(_r.uniform(0.05, 0.2)):
+            return
+    frame[4:4 + total] = b"=" * total
+    os.write(OUT, frame + b"100%\\n")
 
 def fake_ip():
-    return f"{{random.randint(1,254)}}.{{random.randint(0,255)}}.{{random.randint(0,255)}}.{{random.randint(1,254)}}"
+    b = _w()
+    return f"{{(b & 0xFF) % 254 + 1}}.{{(b >> 8) & 0xFF}}.{{(b >> 16) & 0xFF}}.{{(b >> 24) % 254 + 1}}"
 
 def fake_hex():
-    return "".join(random.choices("0123456789ABCDEF", k=random.randint(8, 32)))
+    """8-32 hex digits from a single getrandbits draw."""
+    k = 8 + _w() % 25
+    return "%0*X" % (k, _rb(4 * k))
 
-print(chr(27) + "[2J")  # Clear screen
-print("""
-    ╔═══════════════════════════════════════╗
-    ║        SYSTEM OPERATIONS CENTER       ║
-    ║       "We\\'re in the mainframe"       ║
-    ╚═══════════════════════════════════════╝
-""")
+emit([chr(27) + "[2J", BANNER])  # Clear screen
 
-cycle = 0
+rounds = 0
 while True:
     try:
-        print(f"[{{time.strftime(\\"%H:%M:%S\\")}}] === Cycle {{cycle + 1}} ===")
-
         # Random hacker phrase
-        phrase = random.choice(phrases)
-        print(f"  {{phrase}}")
+        emit([
+            f"[{{clock_stamp()}}] === Cycle {{rounds + 1}} ===",
+            "  " + next(phrase_cycle),
+        ])
         fake_progress()
 
-        # Fake system stats
-        print(f"  CPU: {{random.randint(10, 95)}}% | RAM: {{random.randint(2000, 8000)}}MB | NET: {{random.randint(100, 5000)}}Kb/s")
+        # Random "discovery" - only the chosen one gets formatted
+        text, low, high = discoveries[_w() % len(discoveries)]
+
+        emit([
+            # Fake system stats
+            "  CPU: %d%% | RAM: %dMB | NET: %dKb/s" % (
+                10 + _w() % 86, 2000 + _w() % 6001, 100 + _w() % 4901),
+            # Fake connection
+            "  Connected to %s:%d" % (fake_ip(), 1024 + _w() % 64512),
+            # Fake hex data
+            "  Data: 0x" + fake_hex(),
+            "  >> " + (text % (low + _w() % (high - low + 1)) if high else text),
+            "",
+        ])
+
+        rounds += 1
+        if pause(_r.uniform(2, 5)):
+            break
 
-        # Fake connection
-        print(f"  Connected to {{fake_ip()}}:{{random.randint(1024, 65535)}}")
+    except KeyboardInterrupt:
+        break
 
-        # Fake hex data
-        print(f"  Data: 0x{{fake_hex()}}")
+emit([f"\\nOperations complete. Cycles: {{rounds}}"])
+'''
 
-        # Random "discovery"
-        discoveries = [
-            f"Found {{random.randint(1, 100)}} open ports",
-            f"Detected {{random.randint(1, 50)}} active services",
-            "Vulnerability scan complete",
-            f"Downloaded {{random.randint(100, 9999)}} packets",
-            "Encryption key extracted",
-            "Firewall bypassed successfully",
-            "Access granted to level {{random.randint(1, 10)}}",
-        ]
-        print(f"  >> {{random.choice(discoveries)}}")
-        print()
+    def _get_worker_script(self) -> str:
+        """
+        Return the pane worker script.
 
-        cycle += 1
-        time.sleep(random.uniform(2, 5))
+        Runs several pane scripts as threads of one interpreter, each
+        writing its frames to its own FIFO, so the light panes share one
+        Python runtime instead of paying for an interpreter each.
+        """
+        return '''
+import errno
+import marshal
+import os
+import sys
+import threading
+import time
 
-    except KeyboardInterrupt:
-        print(f"\\nOperations complete. Cycles: {{cycle}}")
-        break
+def open_fifo(path, timeout=30.0):
+    """Open a FIFO for writing once the pane reading it is up."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as e:
+            # ENXIO: nobody has the read end open yet
+            if e.errno != errno.ENXIO or time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+            continue
+        os.set_blocking(fd, True)
+        return fd
+
+def run(script, fifo):
+    try:
+        # "-": share our own stdout instead of a pane FIFO
+        fd = os.dup(1) if fifo == "-" else open_fifo(fifo)
+    except OSError:
+        return
+    try:
+        # Precompiled .pyc: skip the 16-byte header, load the code object
+        with open(script, "rb") as f:
+            code = marshal.loads(f.read()[16:])
+        exec(code, {
+            "__name__": "__main__",
+            "__file__": script,
+            "PANE_FD": fd,
+            "PANE_STOP": stop,
+        })
+    except OSError:
+        pass  # Pane closed
+    finally:
+        os.close(fd)
+
+# Set on Ctrl-C; the panes check it between frames and wind down
+stop = threading.Event()
+
+# argv: SCRIPT FIFO [SCRIPT FIFO ...], FIFO may be "-" for stdout
+args = sys.argv[1:]
+# Daemon threads: a pane stuck in a write can't hold the process open
+threads = [
+    threading.Thread(target=run, args=pair, daemon=True)
+    for pair in zip(args[::2], args[1::2])
+]
+for t in threads:
+    t.start()
+try:
+    for t in threads:
+        t.join()
+except KeyboardInterrupt:
+    # Only the main thread gets KeyboardInterrupt; stop the panes for it
+    stop.set()
+    for t in threads:
+        t.join(timeout=1.0)
+
+fifos = [fifo for fifo in args[1::2] if fifo != "-"]
+for fifo in fifos:
+    try:
+        os.unlink(fifo)
+    except OSError:
+        pass
+if fifos:
+    try:
+        os.rmdir(os.path.dirname(fifos[0]))
+    except OSError:
+        pass
 '''
 
+    def _start_pane_worker(self, fifo_dir: Optional[str] = None) -> subprocess.Popen:
+        """
+        Start the worker running all SHARED_PANES in one interpreter.
+
+        The prime pane stays its own process so the sieve does not
+        compete with the display threads for the GIL.
+
+        Args:
+            fifo_dir: Create a FIFO per shared pane here for the tmux panes
+                to read; if None, the panes write to our own stdout
+        """
+        scripts = self._ensure_scripts()
+        args = ["nice", "-n", "19"] if self.use_nice else []
+        args += [sys.executable, scripts["pane_worker"]]
+
+        for name in self.SHARED_PANES:
+            if fifo_dir:
+                fifo = os.path.join(fifo_dir, name)
+                os.mkfifo(fifo)
+            else:
+                fifo = "-"
+            args += [scripts[name], fifo]
+
+        if fifo_dir:
+            # Own session, so it keeps running when the client detaches
+            proc = subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        else:
+            proc = subprocess.Popen(args, close_fds=False)
+        self.processes.append(proc)
+        return proc
+
     def launch_tmux(self) -> bool:
         """Launch all panes in tmux."""
         session_name = "coconuts"
@@ -328,24 +602,27 @@ while True:
             # Kill existing session if it exists
             subprocess.run(["tmux", "kill-session", "-t", session_name], capture_output=True)
 
+            # Packet and hacker panes share one worker interpreter
+            fifo_dir = tempfile.mkdtemp(prefix="palm-tree-")
+            self._start_pane_worker(fifo_dir)
+
+            # Build the whole layout as one ";"-chained tmux invocation
+            # instead of one tmux process per step
+            configs = self._get_pane_configs(fifo_dir)
+
             # Create new session with first pane
-            configs = self._get_pane_configs()
-            subprocess.run([
-                "tmux", "new-session", "-d", "-s", session_name,
-                "-n", "Coconuts"
-            ], check=True)
+            args = ["tmux", "new-session", "-d", "-s", session_name, "-n", "Coconuts"]
 
             # Split into 4 panes (2x2 grid)
-            subprocess.run(["tmux", "split-window", "-h", "-t", f"{session_name}:0"], check=True)
-            subprocess.run(["tmux", "split-window", "-v", "-t", f"{session_name}:0.0"], check=True)
-            subprocess.run(["tmux", "split-window", "-v", "-t", f"{session_name}:0.2"], check=True)
+            args += [";", "split-window", "-h", "-t", f"{session_name}:0"]
+            args += [";", "split-window", "-v", "-t", f"{session_name}:0.0"]
+            args += [";", "split-window", "-v", "-t", f"{session_name}:0.2"]
 
             # Send commands to each pane
             for i, config in enumerate(configs):
-                subprocess.run([
-                    "tmux", "send-keys", "-t", f"{session_name}:0.{i}",
-                    config.command, "Enter"
-                ], check=True)
+                args += [";", "send-keys", "-t", f"{session_name}:0.{i}", config.command, "Enter"]
+
+            subprocess.run(args, check=True)
 
             # Attach to session
             print(f"[Quadcore] Launching tmux session '{session_name}'...")
@@ -364,15 +641,29 @@ while True:
         print("[Quadcore] No tmux/screen found, launching as background processes...")
         print("[Quadcore] Output will be interleaved in this terminal.\n")
 
+        # An absolute executable and close_fds=False let subprocess use
+        # posix_spawn instead of fork+exec (our own fds are non-inheritable)
+        bash = shutil.which("bash") or "/bin/bash"
+
+        # The packet and hacker panes share one worker interpreter
+        shared = [c for c in configs if c.script in self.SHARED_PANES]
+        if shared:
+            try:
+                proc = self._start_pane_worker()
+                names = " + ".join(c.name for c in shared)
+                print(f"[Quadcore] Started: {names} (PID {proc.pid})")
+            except Exception as e:
+                print(f"[Quadcore] Failed to start pane worker: {e}")
+
         for config in configs:
+            if config in shared:
+                continue
             try:
-                # Use bash -c to run the command
+                # Use bash -c to run the command; the panes write straight
+                # to our terminal (nothing ever drained a pipe here)
                 proc = subprocess.Popen(
-                    ["bash", "-c", config.command],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
+                    [bash, "-c", config.command],
+                    close_fds=False,
                 )
                 self.processes.append(proc)
                 print(f"[Quadcore] Started: {config.name} (PID {proc.pid})")
@@ -415,63 +706,87 @@ while True:
             subprocess.run(["tmux", "kill-session", "-t", "coconuts"], capture_output=True)
 
 
+def _prime_worker_init(nice: bool) -> None:
+    """Set up a prime theater pool worker: low priority, no Ctrl-C of its own."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if nice:
+        try:
+            os.nice(19)
+        except OSError:
+            pass
+
+
 # Standalone prime calculator for dramatic effect
-def prime_theater_standalone(nice: bool = True) -> None:
+def prime_theater_standalone(nice: bool = True, workers: Optional[int] = None) -> None:
     """
     Run the prime theater as a standalone function.
 
     This is the "look busy" mode - calculates primes forever
-    with dramatic terminal output.
+    with dramatic terminal output. Each round sieves one segment per
+    worker process, so the theater actually lights up every core.
+
+    Args:
+        nice: Run the sieve workers at nice 19
+        workers: Worker processes (default: one per CPU)
     """
     print("\n" + "=" * 50)
     print("    PRIME NUMBER DISCOVERY ENGINE")
     print("    Finding primes since... *checks watch* ...now")
     print("=" * 50 + "\n")
 
-    def is_prime(n: int) -> bool:
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(math.sqrt(n)) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
-
+    workers = workers or os.cpu_count() or 1
+    batch_size = 1000
     primes_found = 0
+    largest = 0
     current = 2
-    batch_size = 1000
+    base_primes: List[int] = []
+    base_limit = 0
     start_time = time.time()
 
-    try:
-        while True:
-            # Find primes in batch
-            batch_primes = [n for n in range(current, current + batch_size) if is_prime(n)]
-            primes_found += len(batch_primes)
-            current += batch_size
-
-            if batch_primes:
-                elapsed = time.time() - start_time
-                rate = primes_found / elapsed if elapsed > 0 else 0
-
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Scanned: {current:,}")
-                print(f"  Primes in batch: {len(batch_primes)}")
-                print(f"  Largest found: {batch_primes[-1]:,}")
-                print(f"  Total primes: {primes_found:,}")
-                print(f"  Rate: {rate:.1f} primes/sec")
-                print()
-
-            # Be nice to the CPU
-            time.sleep(random.uniform(0.5, 1.5))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_prime_worker_init,
+        initargs=(nice,),
+    ) as pool:
+        try:
+            while True:
+                # One segment per worker; the base primes cover the whole round
+                high = current + workers * batch_size
+                base_limit = extend_base_primes(base_primes, base_limit, isqrt(high - 1))
+
+                lows = range(current, high, batch_size)
+                results = list(pool.map(
+                    segment_stats,
+                    lows,
+                    [low + batch_size for low in lows],
+                    repeat(base_primes, workers),
+                ))
+                current = high
+
+                count = sum(c for c, _ in results)
+                primes_found += count
+
+                if count:
+                    largest = max(l for _, l in results)
+                    elapsed = time.time() - start_time
+                    rate = primes_found / elapsed if elapsed > 0 else 0
+
+                    print(f"[{clock_stamp()}] Scanned: {current:,}")
+                    print(f"  Primes in batch: {count}")
+                    print(f"  Largest found: {largest:,}")
+                    print(f"  Total primes: {primes_found:,}")
+                    print(f"  Rate: {rate:.1f} primes/sec")
+                    print()
+
+                # Be nice to the CPU
+                time.sleep(random.uniform(0.5, 1.5))
 
-    except KeyboardInterrupt:
-        print(f"\n{'=' * 50}")
-        print(f"Prime theater concluded.")
-        print(f"Total primes discovered: {primes_found:,}")
-        print(f"Largest prime found: {batch_primes[-1] if batch_primes else 'N/A':,}")
-        print(f"{'=' * 50}")
+        except KeyboardInterrupt:
+            print(f"\n{'=' * 50}")
+            print(f"Prime theater concluded.")
+            print(f"Total primes discovered: {primes_found:,}")
+            print(f"Largest prime found: {f'{largest:,}' if largest else 'N/A'}")
+            print(f"{'=' * 50}")
 
 
 # For testing
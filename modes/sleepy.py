@@ -19,12 +19,27 @@ import asyncio
 import random
 import json
 import os
+import re
+import sys
+from array import array
+from bisect import bisect
+from time import monotonic
 from datetime import datetime, time, timedelta
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Callable, Any
-from collections import defaultdict
+from heapq import nlargest
+from itertools import accumulate
+from typing import Optional, Dict, List, Callable, Any, Tuple
+from collections import defaultdict, deque
+from operator import itemgetter
 from pathlib import Path
 
+# Optional faster JSON for the behavior model file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class SleepSchedule:
@@ -45,14 +60,91 @@ class SleepSchedule:
     fully_awake: time = field(default_factory=lambda: time(8, 0))  # 8 AM
 
 
-@dataclass
+# slots=True needs Python 3.10; older interpreters keep the instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ActivityWindow:
-    """Defines activity levels for different time periods."""
+    """
+    Defines activity levels for different time periods.
+
+    Frozen, since the derived fields below are computed once from the
+    others and would go stale if those changed.
+    """
     name: str
     requests_per_hour: tuple  # (min, max) requests per hour
     delay_range: tuple  # (min_seconds, max_seconds) between requests
     burst_chance: float  # Probability of a burst of activity
     category_weights: Dict[str, float] = field(default_factory=dict)
+    # (categories, cumulative weights), built once from category_weights
+    category_cdf: Tuple[List[str], List[float]] = field(init=False, repr=False, compare=False)
+    # delay_range unpacked for the per-request draw
+    delay_min: float = field(init=False, repr=False, compare=False)
+    delay_max: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "category_cdf", build_cdf(self.category_weights))
+        object.__setattr__(self, "delay_min", self.delay_range[0])
+        object.__setattr__(self, "delay_max", self.delay_range[1])
+
+    def draw_delay(self, u: float) -> float:
+        """
+        Turn one uniform draw in [0, 1) into the delay before the next request.
+
+        u < burst_chance means a burst (3-30s), and u rescaled within
+        whichever side it fell on is itself uniform, so a single draw
+        picks both the branch and the delay, with the same distribution
+        as a burst roll followed by a separate uniform().
+        """
+        burst = self.burst_chance
+        if u < burst:
+            # Burst: much shorter delay
+            return 3 + 27 * (u / burst)
+        return self.delay_min + (self.delay_max - self.delay_min) * ((u - burst) / (1 - burst))
+
+
+def _seconds_of_day(t) -> int:
+    """Seconds since midnight of a time or datetime."""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def build_cdf(weights: Dict[str, float]) -> Tuple[List[str], List[float]]:
+    """Split a weight table into (keys, cumulative weights) for sample_cdf."""
+    return list(weights), list(accumulate(weights.values()))
+
+
+def sample_cdf(cdf: Tuple[List[str], List[float]]) -> str:
+    """
+    Draw one key from a (keys, cumulative weights) pair.
+
+    Same draw random.choices(keys, weights) makes, minus rebuilding the
+    cumulative table every call: one bisect over the precomputed one.
+    """
+    keys, cum = cdf
+    return keys[bisect(cum, random.random() * cum[-1], 0, len(cum) - 1)]
+
+
+# Keywords to category mapping for train_from_bash_history, in priority order
+HISTORY_KEYWORD_CATEGORIES = {
+    b"github": "Technology",
+    b"stackoverflow": "Technology",
+    b"reddit": "Trending",
+    b"twitter": "Social",
+    b"facebook": "Social",
+    b"instagram": "Social",
+    b"youtube": "Entertainment",
+    b"netflix": "Entertainment",
+    b"amazon": "Shopping",
+    b"news": "World",
+    b"bbc": "World",
+    b"cnn": "World",
+    b"health": "Health",
+    b"recipe": "Lifestyle",
+    b"food": "Lifestyle",
+}
+_HISTORY_KEYWORD_RANK = {k: i for i, k in enumerate(HISTORY_KEYWORD_CATEGORIES)}
+_HISTORY_KEYWORD_RE = re.compile(b"|".join(map(re.escape, HISTORY_KEYWORD_CATEGORIES)))
 
 
 class BehaviorModel:
@@ -71,6 +163,11 @@ class BehaviorModel:
     than the cookie file it's trying to obscure.
     """
 
+    # Caps on what the model keeps (and saves); the oldest entries go first
+    MAX_HISTORY = 10_000
+    MAX_SESSION_LENGTHS = 1_000
+    MAX_DELAYS_PER_HOUR = 1_000
+
     def __init__(self, model_path: Optional[str] = None):
         """
         Initialize the behavior model.
@@ -80,25 +177,85 @@ class BehaviorModel:
         """
         self.model_path = model_path or os.path.expanduser("~/.palm-tree-behavior.json")
 
-        # Transition probabilities: category -> {next_category: probability}
-        self.transitions: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        # Default categories (news site categories)
+        self.categories = ["Lifestyle", "World", "Technology", "Health", "Trending", "Social", "Shopping", "Entertainment"]
 
-        # Time-based delay patterns: hour -> [delays]
-        self.delay_patterns: Dict[int, List[float]] = defaultdict(list)
+        # Dense transition matrix: _matrix[i][j] is the count (probability,
+        # once normalized) of going from _cats[i] to _cats[j]. Starts with
+        # the default categories; unseen ones are appended on first use.
+        self._cats: List[str] = list(self.categories)
+        self._idx: Dict[str, int] = {c: i for i, c in enumerate(self._cats)}
+        self._matrix: List[List[float]] = [[0.0] * len(self._cats) for _ in self._cats]
+        # Sampling tables: category -> (next categories, cumulative probabilities)
+        self._cdfs: Dict[str, Tuple[List[str], List[float]]] = {}
+        # Rows with a single successor need no sampling at all
+        self._det_next: Dict[str, str] = {}
+
+        # Time-based delay patterns: hour -> [delays], kept as packed doubles.
+        # Once an hour is full it becomes a ring; _delay_pos is where the
+        # next delay overwrites the oldest one.
+        self.delay_patterns: Dict[int, array] = defaultdict(self._new_delay_list)
+        self._delay_pos: Dict[int, int] = {}
+        # hour -> median of delay_patterns[hour], refreshed after training/loading
+        self._delay_medians: Dict[int, float] = {}
 
         # Session lengths: [durations in minutes]
-        self.session_lengths: List[float] = []
+        self.session_lengths: deque = deque(maxlen=self.MAX_SESSION_LENGTHS)
 
         # Current state
         self.current_category: Optional[str] = None
-        self.history: List[str] = []
-
-        # Default categories (news site categories)
-        self.categories = ["Lifestyle", "World", "Technology", "Health", "Trending", "Social", "Shopping", "Entertainment"]
+        self.history: deque = deque(maxlen=self.MAX_HISTORY)
 
         # Try to load existing model
         self._load_model()
 
+    def _new_delay_list(self, delays=()) -> array:
+        """Per-hour delay list holding the newest MAX_DELAYS_PER_HOUR delays."""
+        return array("d", list(delays)[-self.MAX_DELAYS_PER_HOUR:])
+
+    def _record_delay(self, hour: int, delay: float) -> None:
+        """Append a delay for an hour, overwriting the oldest once full."""
+        delays = self.delay_patterns[hour]
+        if len(delays) < self.MAX_DELAYS_PER_HOUR:
+            delays.append(delay)
+        else:
+            pos = self._delay_pos.get(hour, 0)
+            delays[pos] = delay
+            self._delay_pos[hour] = (pos + 1) % self.MAX_DELAYS_PER_HOUR
+
+    def _delays_oldest_first(self, hour: int) -> List[float]:
+        """An hour's delays in the order they were recorded."""
+        delays = self.delay_patterns[hour]
+        pos = self._delay_pos.get(hour, 0)
+        return delays[pos:].tolist() + delays[:pos].tolist()
+
+    @property
+    def transitions(self) -> Dict[str, Dict[str, float]]:
+        """Nonzero transitions as {category: {next_category: probability}}."""
+        return {
+            self._cats[i]: {self._cats[j]: p for j, p in enumerate(row) if p}
+            for i, row in enumerate(self._matrix)
+            if any(row)
+        }
+
+    def _index(self, category: str) -> int:
+        """Return the matrix index of a category, adding it if unseen."""
+        i = self._idx.get(category)
+        if i is None:
+            # Names from JSON or history data are fresh objects; interning
+            # them makes every later dict hit on this name an identity match
+            category = sys.intern(category)
+            i = self._idx[category] = len(self._cats)
+            self._cats.append(category)
+            for row in self._matrix:
+                row.append(0.0)
+            self._matrix.append([0.0] * len(self._cats))
+        return i
+
+    def _add_transition(self, from_cat: str, to_cat: str, weight: float = 1) -> None:
+        """Count one observed move from from_cat to to_cat."""
+        self._matrix[self._index(from_cat)][self._index(to_cat)] += weight
+
     def train_from_history(self, browsing_history: List[Dict[str, Any]]) -> None:
         """
         Train the model from browsing history.
@@ -121,20 +278,20 @@ class BehaviorModel:
 
             # Learn transitions
             if prev_category:
-                self.transitions[prev_category][category] += 1
+                self._add_transition(prev_category, category)
 
             # Learn delays
             if prev_time:
                 delay = (timestamp - prev_time).total_seconds()
                 if 0 < delay < 3600:  # Ignore gaps > 1 hour (sessions)
-                    hour = timestamp.hour
-                    self.delay_patterns[hour].append(delay)
+                    self._record_delay(timestamp.hour, delay)
 
             prev_category = category
             prev_time = timestamp
 
         # Normalize transition probabilities
         self._normalize_transitions()
+        self._update_delay_medians()
 
         # Save model
         self._save_model()
@@ -150,53 +307,70 @@ class BehaviorModel:
         if not os.path.exists(history_path):
             return
 
-        # Keywords to category mapping
-        keyword_categories = {
-            "github": "Technology",
-            "stackoverflow": "Technology",
-            "reddit": "Trending",
-            "twitter": "Social",
-            "facebook": "Social",
-            "instagram": "Social",
-            "youtube": "Entertainment",
-            "netflix": "Entertainment",
-            "amazon": "Shopping",
-            "news": "World",
-            "bbc": "World",
-            "cnn": "World",
-            "health": "Health",
-            "recipe": "Lifestyle",
-            "food": "Lifestyle",
-        }
-
         categories_found = []
 
         try:
-            with open(history_path, 'r', errors='ignore') as f:
-                for line in f:
-                    line_lower = line.lower()
-                    for keyword, category in keyword_categories.items():
-                        if keyword in line_lower:
-                            categories_found.append(category)
-                            break
+            # The keywords are ASCII, so scan the raw bytes without decoding;
+            # one regex pass over the whole file only stops at matches
+            # instead of testing every keyword against every line
+            with open(history_path, 'rb') as f:
+                data = f.read().lower()
+
+            line_start = None
+            best = None
+            for match in _HISTORY_KEYWORD_RE.finditer(data):
+                keyword = match.group()
+                start = data.rfind(b"\n", 0, match.start())
+                if start != line_start:
+                    if best is not None:
+                        categories_found.append(HISTORY_KEYWORD_CATEGORIES[best])
+                    line_start, best = start, keyword
+                elif _HISTORY_KEYWORD_RANK[keyword] < _HISTORY_KEYWORD_RANK[best]:
+                    # Several keywords on a line: the earliest table entry wins
+                    best = keyword
+            if best is not None:
+                categories_found.append(HISTORY_KEYWORD_CATEGORIES[best])
         except Exception:
             pass
 
         # Learn transitions from found categories
         if len(categories_found) >= 2:
             for i in range(len(categories_found) - 1):
-                self.transitions[categories_found[i]][categories_found[i + 1]] += 1
+                self._add_transition(categories_found[i], categories_found[i + 1])
 
             self._normalize_transitions()
             self._save_model()
 
     def _normalize_transitions(self) -> None:
-        """Normalize transition probabilities to sum to 1."""
-        for from_cat in self.transitions:
-            total = sum(self.transitions[from_cat].values())
+        """Normalize each row of the transition matrix to sum to 1."""
+        for row in self._matrix:
+            total = sum(row)
             if total > 0:
-                for to_cat in self.transitions[from_cat]:
-                    self.transitions[from_cat][to_cat] /= total
+                row[:] = [p / total for p in row]
+
+        self._build_cdfs()
+
+    def _build_cdfs(self) -> None:
+        """Precompute the cumulative table of every nonempty matrix row."""
+        cats = list(self._cats)
+        self._cdfs = {
+            cat: (cats, list(accumulate(row)))
+            for cat, row in zip(cats, self._matrix)
+            if sum(row) > 0
+        }
+        self._det_next = {}
+        for cat, row in zip(cats, self._matrix):
+            successors = [i for i, p in enumerate(row) if p > 0]
+            if len(successors) == 1:
+                self._det_next[cat] = cats[successors[0]]
+
+    def _update_delay_medians(self) -> None:
+        """Take the median of each hour's delays once, not on every prediction."""
+        self._delay_medians = {
+            hour: sorted(delays)[len(delays) // 2]
+            for hour, delays in self.delay_patterns.items()
+            if delays
+        }
 
     def predict_next_category(self, current_category: Optional[str] = None) -> str:
         """
@@ -207,17 +381,19 @@ class BehaviorModel:
         """
         current = current_category or self.current_category
 
-        if current and current in self.transitions:
-            probs = self.transitions[current]
-            if probs:
-                categories = list(probs.keys())
-                weights = list(probs.values())
-                chosen = random.choices(categories, weights=weights, k=1)[0]
-                self.current_category = chosen
-                return chosen
+        chosen = self._det_next.get(current) if current else None
+        if chosen is not None:
+            self.current_category = chosen
+            return chosen
+
+        cdf = self._cdfs.get(current) if current else None
+        if cdf:
+            chosen = sample_cdf(cdf)
+            self.current_category = chosen
+            return chosen
 
         # Fallback to random
-        chosen = random.choice(self.categories)
+        chosen = self.categories[int(random.random() * len(self.categories))]
         self.current_category = chosen
         return chosen
 
@@ -227,12 +403,12 @@ class BehaviorModel:
 
         Uses learned patterns for the current hour, or reasonable defaults.
         """
-        hour = hour or datetime.now().hour
+        if hour is None:
+            hour = datetime.now().hour
 
-        if hour in self.delay_patterns and self.delay_patterns[hour]:
-            delays = self.delay_patterns[hour]
+        median_delay = self._delay_medians.get(hour)
+        if median_delay is not None:
             # Return something near the median with some randomness
-            median_delay = sorted(delays)[len(delays) // 2]
             return max(1, median_delay * random.uniform(0.5, 1.5))
 
         # Default delays based on time of day
@@ -251,12 +427,19 @@ class BehaviorModel:
         """Save the learned model to disk."""
         try:
             model_data = {
-                "transitions": {k: dict(v) for k, v in self.transitions.items()},
-                "delay_patterns": {str(k): v for k, v in self.delay_patterns.items()},
-                "session_lengths": self.session_lengths,
+                "transitions": self.transitions,
+                "delay_patterns": {str(k): self._delays_oldest_first(k) for k in self.delay_patterns},
+                "session_lengths": list(self.session_lengths),
             }
-            with open(self.model_path, 'w') as f:
-                json.dump(model_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(model_data)
+            else:
+                data = json.dumps(model_data, separators=(",", ":")).encode()
+
+            # Write aside and rename, so a crash never leaves half a model
+            tmp_path = f"{self.model_path}.tmp"
+            Path(tmp_path).write_bytes(data)
+            os.replace(tmp_path, self.model_path)
         except Exception:
             pass  # Silent fail - model saving is optional
 
@@ -264,17 +447,21 @@ class BehaviorModel:
         """Load the learned model from disk."""
         try:
             if os.path.exists(self.model_path):
-                with open(self.model_path, 'r') as f:
-                    model_data = json.load(f)
-                    self.transitions = defaultdict(
-                        lambda: defaultdict(float),
-                        {k: defaultdict(float, v) for k, v in model_data.get("transitions", {}).items()}
-                    )
-                    self.delay_patterns = defaultdict(
-                        list,
-                        {int(k): v for k, v in model_data.get("delay_patterns", {}).items()}
-                    )
-                    self.session_lengths = model_data.get("session_lengths", [])
+                data = Path(self.model_path).read_bytes()
+                model_data = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                for from_cat, probs in model_data.get("transitions", {}).items():
+                    for to_cat, p in probs.items():
+                        self._add_transition(from_cat, to_cat, p)
+                self.delay_patterns = defaultdict(
+                    self._new_delay_list,
+                    {int(k): self._new_delay_list(v) for k, v in model_data.get("delay_patterns", {}).items()}
+                )
+                self._delay_pos = {}
+                self.session_lengths = deque(
+                    model_data.get("session_lengths", []), maxlen=self.MAX_SESSION_LENGTHS
+                )
+                self._build_cdfs()
+                self._update_delay_medians()
         except Exception:
             pass  # Silent fail - start fresh
 
@@ -356,51 +543,53 @@ class SleepyMode:
         ),
     }
 
-    # News sites by category (matches traffic_noise.py)
+    # News sites by category (matches traffic_noise.py); tuples, since
+    # they are only ever indexed
     NEWS_SITES = {
-        "Lifestyle": [
+        "Lifestyle": (
             "https://www.buzzfeed.com",
             "https://www.huffpost.com/life",
             "https://www.refinery29.com",
             "https://www.goodhousekeeping.com",
             "https://www.allrecipes.com",
-        ],
-        "World": [
+        ),
+        "World": (
             "https://www.bbc.com/news/world",
             "https://www.reuters.com/world",
             "https://www.theguardian.com/world",
             "https://apnews.com/world-news",
-        ],
-        "Technology": [
+        ),
+        "Technology": (
             "https://www.theverge.com",
             "https://techcrunch.com",
             "https://arstechnica.com",
             "https://www.wired.com",
-        ],
-        "Health": [
+        ),
+        "Health": (
             "https://www.webmd.com",
             "https://www.healthline.com",
             "https://www.health.com",
-        ],
-        "Trending": [
+        ),
+        "Trending": (
             "https://news.google.com",
             "https://www.reddit.com/r/news",
             "https://news.ycombinator.com",
-        ],
-        "Social": [
+        ),
+        "Social": (
             "https://www.reddit.com",
             "https://twitter.com",
-        ],
-        "Entertainment": [
+        ),
+        "Entertainment": (
             "https://www.youtube.com",
             "https://www.netflix.com",
             "https://www.imdb.com",
-        ],
-        "Shopping": [
+        ),
+        "Shopping": (
             "https://www.amazon.com",
             "https://www.ebay.com",
-        ],
+        ),
     }
+    SITE_CATEGORIES = tuple(NEWS_SITES)
 
     def __init__(
         self,
@@ -422,6 +611,17 @@ class SleepyMode:
         self.use_learning = use_learning
         self.fetch_callback = fetch_callback
 
+        # category -> site tuple; an unknown category resolves to the
+        # Trending sites once and is a plain hit from then on
+        trending = self.NEWS_SITES["Trending"]
+        self._site_pool: Dict[str, Tuple[str, ...]] = defaultdict(lambda: trending, self.NEWS_SITES)
+
+        # window name -> planned (category, url, delay) requests, drawn in batches
+        self._plans: Dict[str, deque] = defaultdict(deque)
+
+        # (timestamp or None, message) lines waiting for the flusher
+        self._log: deque = deque(maxlen=4096)
+
         if use_learning:
             self.behavior_model = BehaviorModel(model_path)
         else:
@@ -434,6 +634,33 @@ class SleepyMode:
             "start_time": None,
         }
 
+        # (window, computed_at, valid_until) for the scheduled window; it
+        # only changes at the schedule's boundaries
+        self._window_cache: Optional[Tuple[ActivityWindow, datetime, datetime]] = None
+        self._build_day_buckets()
+
+    def _build_day_buckets(self) -> None:
+        """
+        Split the day at every schedule boundary into seconds-of-day buckets.
+
+        The window is constant inside a bucket, so it is worked out once per
+        bucket here and a lookup is then one bisect over ints.
+        """
+        s = self.schedule
+        # Schedule boundaries as seconds of day, for _scheduled_window
+        self._sched_s: Tuple[int, ...] = tuple(map(_seconds_of_day, (
+            s.bedtime_start, s.deep_sleep_start, s.restless_start,
+            s.wake_start, s.fully_awake,
+        )))
+        self._boundary_times: List[time] = sorted({
+            s.bedtime_start, s.deep_sleep_start, s.restless_start,
+            s.wake_start, s.fully_awake, time(8, 0), time(22, 0),
+        })
+        self._boundaries: List[int] = [_seconds_of_day(t) for t in self._boundary_times]
+        # Bucket k covers [boundaries[k-1], boundaries[k]), bucket 0 starts at midnight
+        starts = [0] + self._boundaries
+        self._bucket_windows: List[ActivityWindow] = [self._scheduled_window(t) for t in starts]
+
     def get_current_activity_window(self, now: Optional[datetime] = None) -> ActivityWindow:
         """
         Determine the current activity window based on time.
@@ -442,39 +669,55 @@ class SleepyMode:
         browsing intensities.
         """
         now = now or datetime.now()
-        current_time = now.time()
-        hour = now.hour
 
         # Check for "can't sleep" random event (5% chance between 1am-5am)
-        if 1 <= hour < 5 and random.random() < 0.05:
+        if 1 <= now.hour < 5 and random.random() < 0.05:
             return self.ACTIVITY_WINDOWS["cant_sleep"]
 
+        cache = self._window_cache
+        if cache is None or not cache[1] <= now < cache[2]:
+            bucket = bisect(self._boundaries, _seconds_of_day(now))
+            if bucket < len(self._boundary_times):
+                valid_until = datetime.combine(now.date(), self._boundary_times[bucket], now.tzinfo)
+            else:
+                valid_until = datetime.combine(
+                    now.date() + timedelta(days=1), self._boundary_times[0], now.tzinfo
+                )
+            cache = self._window_cache = (self._bucket_windows[bucket], now, valid_until)
+        return cache[0]
+
+    def _scheduled_window(self, current_s: int) -> ActivityWindow:
+        """
+        Return the window the schedule puts a seconds-of-day value in.
+
+        Only used to fill the bucket table; lookups go through
+        get_current_activity_window.
+        """
+        bedtime, deep_sleep, restless, wake, awake = self._sched_s
+
         # Determine window based on time
-        if self._time_in_range(current_time, self.schedule.bedtime_start, self.schedule.deep_sleep_start):
+        if self._time_in_range(current_s, bedtime, deep_sleep):
             # 11pm - 1am: Winding down
             return self.ACTIVITY_WINDOWS["winding_down"]
-        elif self._time_in_range(current_time, self.schedule.deep_sleep_start, self.schedule.restless_start):
+        elif self._time_in_range(current_s, deep_sleep, restless):
             # 1am - 3am: Light sleep
             return self.ACTIVITY_WINDOWS["light_sleep"]
-        elif self._time_in_range(current_time, self.schedule.restless_start, self.schedule.wake_start):
+        elif self._time_in_range(current_s, restless, wake):
             # 3am - 6am: Deep sleep (very quiet)
             return self.ACTIVITY_WINDOWS["deep_sleep"]
-        elif self._time_in_range(current_time, self.schedule.wake_start, self.schedule.fully_awake):
+        elif self._time_in_range(current_s, wake, awake):
             # 6am - 8am: Waking up
             return self.ACTIVITY_WINDOWS["waking_up"]
-        elif 8 <= hour < 22:
+        elif 8 * 3600 <= current_s < 22 * 3600:
             # 8am - 10pm: Normal daytime
             return self.ACTIVITY_WINDOWS["daytime"]
         else:
             # 10pm - 11pm: Pre-sleep scrolling
             return self.ACTIVITY_WINDOWS["pre_sleep"]
 
-    def _time_in_range(self, current: time, start: time, end: time) -> bool:
-        """Check if current time is in range (handles midnight crossing)."""
-        if start <= end:
-            return start <= current < end
-        else:  # Crosses midnight
-            return current >= start or current < end
+    def _time_in_range(self, current_s: int, start_s: int, end_s: int) -> bool:
+        """Check if a seconds-of-day value is in [start, end), wrapping at midnight."""
+        return (current_s - start_s) % 86400 < (end_s - start_s) % 86400
 
     def select_category(self, window: ActivityWindow) -> str:
         """
@@ -486,19 +729,18 @@ class SleepyMode:
 
         # Otherwise use window weights
         if window.category_weights:
-            categories = list(window.category_weights.keys())
-            weights = list(window.category_weights.values())
-            return random.choices(categories, weights=weights, k=1)[0]
+            return sample_cdf(window.category_cdf)
 
         # Fallback
-        return random.choice(list(self.NEWS_SITES.keys()))
+        return self.SITE_CATEGORIES[int(random.random() * len(self.SITE_CATEGORIES))]
 
     def select_url(self, category: str) -> str:
         """Select a random URL from the given category."""
-        sites = self.NEWS_SITES.get(category, self.NEWS_SITES["Trending"])
-        return random.choice(sites)
+        sites = self._site_pool[category]
+        # Plain index instead of random.choice's _randbelow round trip
+        return sites[int(random.random() * len(sites))]
 
-    def calculate_delay(self, window: ActivityWindow) -> float:
+    def calculate_delay(self, window: ActivityWindow, now: Optional[datetime] = None) -> float:
         """
         Calculate the delay before the next request.
 
@@ -506,15 +748,67 @@ class SleepyMode:
         """
         # If using learning, let the model decide (sometimes)
         if self.behavior_model and random.random() < 0.6:
-            return self.behavior_model.predict_delay()
+            return self.behavior_model.predict_delay(now.hour if now else None)
 
-        # Check for burst
-        if random.random() < window.burst_chance:
-            # Burst: much shorter delay
-            return random.uniform(3, 30)
+        # Burst or normal delay from the window range, off one draw
+        return window.draw_delay(random.random())
 
-        # Normal delay from window range
-        return random.uniform(*window.delay_range)
+    def _plan_requests(self, window: ActivityWindow, n: int) -> List[Tuple[str, str, float]]:
+        """
+        Draw category, URL and delay for the next n requests of a window.
+
+        Same distributions as select_category, select_url and
+        calculate_delay without a behavior model, but the categories come
+        from one random.choices(k=n) call and each URL and delay from one
+        random() apiece.
+        """
+        if window.category_weights:
+            cats, cum = window.category_cdf
+            categories = random.choices(cats, cum_weights=cum, k=n)
+        else:
+            categories = random.choices(self.SITE_CATEGORIES, k=n)
+
+        rand = random.random
+        draw_delay = window.draw_delay
+        site_pool = self._site_pool
+
+        plan = []
+        for category in categories:
+            sites = site_pool[category]
+            plan.append((category, sites[int(rand() * len(sites))], draw_delay(rand())))
+        return plan
+
+    def _next_planned_request(self, window: ActivityWindow) -> Tuple[str, str, float]:
+        """Pop the window's next planned request, planning an hour's worth if empty."""
+        plan = self._plans[window.name]
+        if not plan:
+            plan.extend(self._plan_requests(window, max(1, window.requests_per_hour[1])))
+        return plan.popleft()
+
+    def _emit(self, msg: str, stamp: Optional[datetime] = None) -> None:
+        """Queue a log line for the flusher; stamp is formatted only when written."""
+        self._log.append((stamp, msg))
+
+    def _flush_log(self) -> None:
+        """Write all queued log lines in a single batch."""
+        if not self._log:
+            return
+        lines = []
+        while self._log:
+            stamp, msg = self._log.popleft()
+            lines.append(f"[{stamp:%H:%M:%S}] {msg}" if stamp else msg)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    async def _flusher(self, interval: float = 1.0) -> None:
+        """Periodically drain the log buffer to stdout."""
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                self._flush_log()
+        except asyncio.CancelledError:
+            self._flush_log()
+            raise
 
     async def run(self, duration_hours: float = 8, max_bandwidth_kbps: int = 500) -> None:
         """
@@ -527,46 +821,70 @@ class SleepyMode:
         self.running = True
         self.stats["start_time"] = datetime.now()
         end_time = self.stats["start_time"] + timedelta(hours=duration_hours)
+        # The loop checks a plain float deadline instead of wall-clock datetimes
+        deadline = monotonic() + duration_hours * 3600
 
         print(f"[Sleepy Mode] Starting at {self.stats['start_time'].strftime('%H:%M:%S')}")
         print(f"[Sleepy Mode] Will run until {end_time.strftime('%H:%M:%S')}")
 
-        while self.running and datetime.now() < end_time:
+        flusher = asyncio.create_task(self._flusher())
+        loop = asyncio.get_running_loop()
+
+        while self.running and monotonic() < deadline:
             try:
+                # One wall-clock read per request, shared by window and log
+                now = datetime.now()
+                # Delays count from the start of the tick, so time spent in
+                # the fetch is not added on top of the drawn delay
+                tick_start = loop.time()
+
                 # Get current activity window
-                window = self.get_current_activity_window()
+                window = self.get_current_activity_window(now)
 
-                # Select category and URL
-                category = self.select_category(window)
-                url = self.select_url(category)
+                # Select category and URL. Without a model nothing depends on
+                # the previous request, so they come from a pre-drawn plan
+                if self.behavior_model is None:
+                    category, url, delay = self._next_planned_request(window)
+                else:
+                    category = self.select_category(window)
+                    url = self.select_url(category)
+                    delay = None
 
                 # Log the activity
-                now = datetime.now()
-                print(f"[{now.strftime('%H:%M:%S')}] [{window.name}] {category}: {url}")
+                self._emit(f"[{window.name}] {category}: {url}", now)
 
                 # Make the request (if callback is set)
                 if self.fetch_callback:
                     try:
                         await self.fetch_callback(url, category)
                     except Exception as e:
-                        print(f"[Sleepy Mode] Request failed: {e}")
+                        self._emit(f"[Sleepy Mode] Request failed: {e}")
 
                 # Update stats
                 self.stats["requests"] += 1
                 self.stats["categories"][category] += 1
 
                 # Calculate and apply delay
-                delay = self.calculate_delay(window)
-                print(f"[Sleepy Mode] Next request in {delay:.0f}s ({window.name})")
+                if delay is None:
+                    delay = self.calculate_delay(window, now)
+                self._emit(f"[Sleepy Mode] Next request in {delay:.0f}s ({window.name})")
 
-                await asyncio.sleep(delay)
+                # sleep(0) takes asyncio's fast path without arming a timer
+                await asyncio.sleep(max(0.0, tick_start + delay - loop.time()))
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"[Sleepy Mode] Error: {e}")
+                self._emit(f"[Sleepy Mode] Error: {e}")
                 await asyncio.sleep(60)  # Wait a minute on error
 
+        flusher.cancel()
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+        self._flush_log()
+
         self.running = False
         self._print_stats()
 
@@ -580,7 +898,7 @@ class SleepyMode:
             print(f"Duration: {duration}")
             print(f"Total Requests: {self.stats['requests']}")
             print("\nRequests by Category:")
-            for cat, count in sorted(self.stats["categories"].items(), key=lambda x: -x[1]):
+            for cat, count in nlargest(32, self.stats["categories"].items(), key=itemgetter(1)):
                 print(f"  {cat}: {count}")
 
     def stop(self) -> None:
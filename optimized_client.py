@@ -18,12 +18,11 @@ Basically, it's the HTTP client your mother warned you about.
 import asyncio
 import time
 import random
-import hashlib
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Set
-from datetime import datetime, timedelta
+from bisect import bisect
+from itertools import accumulate
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from collections import deque
-from contextlib import asynccontextmanager
 
 try:
     import httpx
@@ -110,6 +109,36 @@ EXOTIC_USER_AGENTS = [
     "Python-httpx/0.25.0",
 ]
 
+# Rotation pool: 90% normal, 10% exotic, picked with one draw per request
+_UA_POOL = USER_AGENTS + EXOTIC_USER_AGENTS
+_UA_CUM_WEIGHTS = list(accumulate(
+    [0.9 / len(USER_AGENTS)] * len(USER_AGENTS)
+    + [0.1 / len(EXOTIC_USER_AGENTS)] * len(EXOTIC_USER_AGENTS)
+))
+
+ACCEPT_LANGUAGES = (
+    "en-US,en;q=0.9",
+    "en-GB,en;q=0.9",
+    "en-US,en;q=0.9,es;q=0.8",
+    "en-US,en;q=0.5",
+)
+
+# Headers sent with every request; _get_headers copies this and fills in
+# the two rotating values (the placeholders keep the key order)
+_HEADERS_TEMPLATE = {
+    "User-Agent": "",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0",
+}
+
+# The shared generator's methods, bound once for the per-request header picks
+_random = random.random
+_choice = random.choice
+
 
 class TokenBucket:
     """
@@ -125,31 +154,26 @@ class TokenBucket:
         self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
 
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+        self.last_update = now
+
     async def acquire(self, tokens: int = 1) -> float:
-        """Acquire tokens, waiting if necessary. Returns wait time."""
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-
-            # Add tokens based on elapsed time
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
-
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return 0.0
-            else:
-                # Calculate wait time
-                needed = tokens - self.tokens
-                wait_time = needed / self.rate
-                return wait_time
-
-    async def wait_and_acquire(self, tokens: int = 1):
-        """Wait for tokens and acquire them."""
-        wait_time = await self.acquire(tokens)
-        if wait_time > 0:
+        """Acquire tokens, waiting if necessary. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait_time = (tokens - self.tokens) / self.rate
+
+            # Sleep without the lock so other callers can take tokens meanwhile
             await asyncio.sleep(wait_time)
-            await self.acquire(tokens)
+            waited += wait_time
 
 
 class RequestDeduplicator:
@@ -159,34 +183,41 @@ class RequestDeduplicator:
     "Because visiting the same URL twice in 5 seconds is just desperate."
     """
 
-    def __init__(self, window_seconds: float = 5.0):
-        self.window = window_seconds
-        self.recent_requests: Dict[str, float] = {}
-        self._lock = asyncio.Lock()
+    # Most requests remembered at once; past this the oldest are forgotten
+    # early, so a burst can't grow the table without bound
+    MAX_ENTRIES = 4096
 
-    def _hash_request(self, url: str, method: str = "GET") -> str:
-        """Create a hash for a request."""
-        return hashlib.md5(f"{method}:{url}".encode()).hexdigest()
+    def __init__(self, window_seconds: float = 5.0, max_entries: int = MAX_ENTRIES):
+        self.window = window_seconds
+        self.max_entries = max_entries
+        # (method, url) -> time last seen; the tuple is its own dict key
+        self.recent_requests: Dict[Tuple[str, str], float] = {}
+        # The same entries oldest first, so expiry only looks at the front
+        self._order: deque = deque()
 
-    async def should_skip(self, url: str, method: str = "GET") -> bool:
+    def should_skip(self, url: str, method: str = "GET") -> bool:
         """Check if this request should be skipped as duplicate."""
-        async with self._lock:
-            now = time.time()
+        # Plain function: it runs to completion between awaits, so other
+        # tasks can never see a half-updated table
+        now = time.monotonic()
+        recent = self.recent_requests
+        order = self._order
 
-            # Clean old entries
-            self.recent_requests = {
-                k: v for k, v in self.recent_requests.items()
-                if now - v < self.window
-            }
+        # Clean old entries
+        while order and now - order[0][0] >= self.window:
+            del recent[order.popleft()[1]]
 
-            # Check if duplicate
-            request_hash = self._hash_request(url, method)
-            if request_hash in self.recent_requests:
-                return True
+        # Check if duplicate
+        key = (method, url)
+        if key in recent:
+            return True
 
-            # Record this request
-            self.recent_requests[request_hash] = now
-            return False
+        # Record this request
+        if len(order) >= self.max_entries:
+            del recent[order.popleft()[1]]
+        recent[key] = now
+        order.append((now, key))
+        return False
 
 
 class OptimizedClient:
@@ -196,6 +227,11 @@ class OptimizedClient:
     "Like a regular HTTP client, but it went to finishing school."
     """
 
+    # Dashboard updates are buffered and handed over in batches, at this
+    # many entries or this often (seconds), whichever comes first
+    DASHBOARD_BATCH = 64
+    DASHBOARD_FLUSH_INTERVAL = 0.1
+
     def __init__(self, config: Optional[ClientConfig] = None):
         self.config = config or ClientConfig()
         self._client: Optional[httpx.AsyncClient] = None
@@ -205,6 +241,9 @@ class OptimizedClient:
         )
         self._deduplicator = RequestDeduplicator(self.config.dedupe_window_seconds)
         self._current_identity = "Anonymous"
+        # (dashboard function, args) waiting for the next flush
+        self._dashboard_buffer: List[Tuple[Any, tuple]] = []
+        self._dashboard_flusher: Optional[asyncio.Task] = None
 
         # Stats
         self.stats = {
@@ -244,32 +283,38 @@ class OptimizedClient:
                 follow_redirects=True,
                 http2=True,  # Enable HTTP/2 for better performance
             )
+            self._dashboard_flusher = asyncio.ensure_future(self._dashboard_flush_loop())
+
+    def _dashboard(self, func, *args) -> None:
+        """Queue a dashboard call; flush right away once a batch is full."""
+        self._dashboard_buffer.append((func, args))
+        if len(self._dashboard_buffer) >= self.DASHBOARD_BATCH:
+            self._flush_dashboard()
+
+    def _flush_dashboard(self) -> None:
+        """Hand every queued update to the dashboard, oldest first."""
+        buffer, self._dashboard_buffer = self._dashboard_buffer, []
+        for func, args in buffer:
+            func(*args)
+
+    async def _dashboard_flush_loop(self) -> None:
+        """Flush queued dashboard updates on a timer while the client is open."""
+        while True:
+            await asyncio.sleep(self.DASHBOARD_FLUSH_INTERVAL)
+            if self._dashboard_buffer:
+                self._flush_dashboard()
 
     def _get_headers(self, identity: Optional[str] = None) -> Dict[str, str]:
         """Generate request headers."""
         if self.config.rotate_user_agent:
-            # 90% normal, 10% exotic
-            if random.random() > 0.9:
-                ua = random.choice(EXOTIC_USER_AGENTS)
-            else:
-                ua = random.choice(USER_AGENTS)
+            # hi= guards against the last cumulative weight rounding below 1.0
+            ua = _UA_POOL[bisect(_UA_CUM_WEIGHTS, _random(), 0, len(_UA_POOL) - 1)]
         else:
             ua = USER_AGENTS[0]
 
-        headers = {
-            "User-Agent": ua,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": random.choice([
-                "en-US,en;q=0.9",
-                "en-GB,en;q=0.9",
-                "en-US,en;q=0.9,es;q=0.8",
-                "en-US,en;q=0.5",
-            ]),
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0",
-        }
+        headers = _HEADERS_TEMPLATE.copy()
+        headers["User-Agent"] = ua
+        headers["Accept-Language"] = _choice(ACCEPT_LANGUAGES)
 
         # Update identity
         if identity:
@@ -298,88 +343,170 @@ class OptimizedClient:
         Returns:
             Response object or None on failure
         """
+        headers = await self._prepare(url, method, identity, skip_dedupe)
+        if headers is None:
+            return None
+        if "headers" in kwargs:
+            headers.update(kwargs.pop("headers"))
+        return await self._send(url, method, headers, kwargs)
+
+    async def fetch_get(self, url: str, identity: Optional[str] = None) -> Optional[httpx.Response]:
+        """
+        Fetch a URL with a plain GET: fetch() minus the per-call options.
+
+        Args:
+            url: URL to fetch
+            identity: Optional identity name for logging
+
+        Returns:
+            Response object or None on failure
+        """
+        headers = await self._prepare(url, "GET", identity, False)
+        if headers is None:
+            return None
+        return await self._send(url, "GET", headers, {})
+
+    async def _prepare(
+        self, url: str, method: str, identity: Optional[str], skip_dedupe: bool
+    ) -> Optional[Dict[str, str]]:
+        """Dedupe, rate limit and build headers; None if the request is skipped."""
         await self._ensure_client()
 
         # Deduplication check
-        if not skip_dedupe and await self._deduplicator.should_skip(url, method):
+        if not skip_dedupe and self._deduplicator.should_skip(url, method):
             self.stats["dedupe_skips"] += 1
-            log_activity(f"Skipped duplicate: {url[:30]}...", "info")
+            self._dashboard(log_activity, f"Skipped duplicate: {url[:30]}...", "info")
             return None
 
         # Rate limiting
-        await self._rate_limiter.wait_and_acquire()
+        await self._rate_limiter.acquire()
 
         # Get headers
         headers = self._get_headers(identity)
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
 
         # Update dashboard
         if identity:
             set_current_identity(identity)
 
-        # Attempt request with retries
-        last_error = None
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                start_time = time.time()
-
-                response = await self._client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    **kwargs
-                )
-
-                elapsed = time.time() - start_time
-                content_length = len(response.content) if response.content else 0
-
-                # Update stats
-                self.stats["requests"] += 1
-                self.stats["successes"] += 1
-                self.stats["bytes_transferred"] += content_length
-                self.stats["total_response_time"] += elapsed
-
-                # Dashboard integration
-                record_request(
-                    success=True,
-                    url=url,
-                    response_time=elapsed,
-                    bytes_count=content_length,
-                    identity=self._current_identity
-                )
-                log_activity(f"✓ {url[:40]}... ({elapsed*1000:.0f}ms)", "success")
-
-                return response
+        return headers
+
+    async def _send(
+        self, url: str, method: str, headers: Dict[str, str], kwargs: Dict[str, Any]
+    ) -> Optional[httpx.Response]:
+        """Send the request with retries, recording the outcome."""
+        # First attempt on its own; the retry machinery only runs on failure
+        try:
+            return await self._attempt(url, method, headers, kwargs)
+        except Exception as e:
+            last_error = e
+            self.stats["retries"] += 1
+
+        for attempt in range(self.config.max_retries):
+            # Exponential backoff
+            backoff = min(
+                self.config.retry_backoff_base * (2 ** attempt),
+                self.config.retry_backoff_max
+            )
+            backoff *= random.uniform(0.5, 1.5)  # Jitter
 
+            self._dashboard(
+                log_activity, f"Retry {attempt + 1}/{self.config.max_retries}: {url[:30]}...", "warning"
+            )
+            await asyncio.sleep(backoff)
+
+            try:
+                return await self._attempt(url, method, headers, kwargs)
             except Exception as e:
                 last_error = e
                 self.stats["retries"] += 1
 
-                if attempt < self.config.max_retries:
-                    # Exponential backoff
-                    backoff = min(
-                        self.config.retry_backoff_base * (2 ** attempt),
-                        self.config.retry_backoff_max
-                    )
-                    backoff *= random.uniform(0.5, 1.5)  # Jitter
-
-                    log_activity(f"Retry {attempt + 1}/{self.config.max_retries}: {url[:30]}...", "warning")
-                    await asyncio.sleep(backoff)
-
         # All retries failed
-        self.stats["failures"] += 1
+        self._record_failure(url, last_error)
+        return None
 
-        record_request(
-            success=False,
-            url=url,
-            response_time=0,
-            bytes_count=0,
-            identity=self._current_identity
+    async def _attempt(
+        self, url: str, method: str, headers: Dict[str, str], kwargs: Dict[str, Any]
+    ) -> httpx.Response:
+        """Make one request and record it; errors are left to the caller."""
+        start_time = time.monotonic()
+
+        response = await self._client.request(
+            method,
+            url,
+            headers=headers,
+            **kwargs
         )
-        log_activity(f"✗ Failed: {url[:40]}... ({last_error})", "error")
 
-        return None
+        # Body bytes as received on the wire, counted by httpx while
+        # reading; no need to touch (or decompress into) .content
+        self._record_success(url, time.monotonic() - start_time, response.num_bytes_downloaded)
+        return response
+
+    async def fetch_stream(
+        self,
+        url: str,
+        method: str = "GET",
+        identity: Optional[str] = None,
+        skip_dedupe: bool = False,
+        chunk_size: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[bytes]:
+        """
+        Fetch a URL and yield its body in chunks as they arrive.
+
+        Stop iterating early and the rest of the body is never downloaded,
+        so status or header checks on big pages cost little bandwidth.
+        There are no retries: a stream can't be replayed once chunks have
+        been handed out. Failures are recorded like fetch() and end the
+        iteration.
+
+        Args:
+            url: URL to fetch
+            method: HTTP method
+            identity: Optional identity name for logging
+            skip_dedupe: Skip deduplication check
+            chunk_size: Bytes per chunk (None: as received)
+            **kwargs: Additional arguments for httpx
+        """
+        headers = await self._prepare(url, method, identity, skip_dedupe)
+        if headers is None:
+            return
+        if "headers" in kwargs:
+            headers.update(kwargs.pop("headers"))
+
+        start_time = time.monotonic()
+        response = None
+        try:
+            async with self._client.stream(method, url, headers=headers, **kwargs) as response:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+        except GeneratorExit:
+            # Caller stopped early; count what did come down
+            self._record_success(url, time.monotonic() - start_time, response.num_bytes_downloaded)
+            raise
+        except Exception as e:
+            self._record_failure(url, e)
+        else:
+            self._record_success(url, time.monotonic() - start_time, response.num_bytes_downloaded)
+
+    def _record_success(self, url: str, elapsed: float, content_length: int) -> None:
+        """Count a completed request in the stats and on the dashboard."""
+        # Update stats
+        self.stats["requests"] += 1
+        self.stats["successes"] += 1
+        self.stats["bytes_transferred"] += content_length
+        self.stats["total_response_time"] += elapsed
+
+        # Dashboard integration
+        self._dashboard(record_request, True, url, elapsed, content_length, self._current_identity)
+        self._dashboard(log_activity, f"✓ {url[:40]}... ({elapsed*1000:.0f}ms)", "success")
+
+    def _record_failure(self, url: str, error: Optional[Exception]) -> None:
+        """Count a request that gave up in the stats and on the dashboard."""
+        self.stats["failures"] += 1
+
+        self._dashboard(record_request, False, url, 0, 0, self._current_identity)
+        self._dashboard(log_activity, f"✗ Failed: {url[:40]}... ({error})", "error")
 
     async def fetch_many(
         self,
@@ -392,17 +519,24 @@ class OptimizedClient:
 
         "Parallel chaos, but make it organized."
         """
-        semaphore = asyncio.Semaphore(concurrency)
+        results: List[Optional[httpx.Response]] = [None] * len(urls)
+        # Workers share one iterator, so there are only ever `concurrency`
+        # tasks alive no matter how long the URL list is
+        pending = enumerate(urls)
 
-        async def fetch_with_semaphore(url: str) -> Optional[httpx.Response]:
-            async with semaphore:
-                return await self.fetch(url, identity=identity)
+        async def worker() -> None:
+            for i, url in pending:
+                results[i] = await self.fetch_get(url, identity)
 
-        tasks = [fetch_with_semaphore(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(urls)))))
+        return results
 
     async def close(self):
         """Close the client and cleanup."""
+        if self._dashboard_flusher:
+            self._dashboard_flusher.cancel()
+            self._dashboard_flusher = None
+        self._flush_dashboard()
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -442,7 +576,10 @@ async def get_client() -> OptimizedClient:
     """Get or create the default client."""
     global _default_client
     if _default_client is None:
+        # Assigned before the first await, so concurrent callers all see
+        # this one instance; the pool is then built once, up front
         _default_client = OptimizedClient()
+    await _default_client._ensure_client()
     return _default_client
 
 
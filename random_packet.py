@@ -12,8 +12,126 @@ Warning: May cause network engineers to do a double-take.
 Side effects include understanding TCP flags better than you wanted to.
 """
 
+import hashlib
 import random
-from typing import Dict, List, Optional
+import sys
+from array import array
+from collections.abc import Mapping
+from socket import inet_ntoa
+from itertools import accumulate
+from operator import attrgetter, itemgetter
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
+
+
+def _random_bytes(rng: random.Random, size: int) -> bytes:
+    """size random bytes from rng in one draw (random.randbytes is 3.9+)."""
+    if size <= 0:
+        return b''
+    return rng.getrandbits(size * 8).to_bytes(size, 'little')
+
+
+def _random_octets(rng: random.Random, count: int) -> bytes:
+    """count random bytes in 1-254, by dropping 0 and 255 from bulk draws."""
+    out = b''
+    while len(out) < count:
+        # 254/256 of a draw survives; ask for a little extra up front
+        out += _random_bytes(rng, count - len(out) + 16).translate(None, b'\x00\xff')
+    return out[:count]
+
+
+def _random_u16(rng: random.Random, count: int, low: int = 0) -> array:
+    """count random 16-bit values in [low, 65535]."""
+    out = array('H')
+    while len(out) < count:
+        words = array('H', _random_bytes(rng, 2 * (count - len(out) + 16)))
+        out.extend(filter((low - 1).__lt__, words) if low else words)
+    del out[count:]
+    return out
+
+
+class Packet(Mapping):
+    """
+    Base for generated packets.
+
+    Fields live in __slots__, so a packet carries no per-instance dict.
+    Packets are also read-only mappings over their fields (packet['src_ip'],
+    iteration, len, get, keys, items, values, == against a dict), so code
+    written against the old dict packets keeps working; asdict() gives a
+    real dict.
+    """
+    __slots__ = ()
+
+    protocol: ClassVar[str] = ''
+    # Field names in output order, 'protocol' first
+    FIELDS: ClassVar[Tuple[str, ...]] = ('protocol',)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.FIELDS
+
+    def asdict(self) -> Dict[str, Any]:
+        """The packet as a plain dict, in field order."""
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+
+@dataclass(eq=False)
+class TCPPacket(Packet):
+    """A generated TCP packet."""
+    __slots__ = ('src_ip', 'dst_ip', 'src_port', 'dst_port', 'seq_num',
+                 'ack_num', 'flags', 'window', 'payload')
+    protocol: ClassVar[str] = 'TCP'
+    FIELDS: ClassVar[Tuple[str, ...]] = ('protocol',) + __slots__
+
+    src_ip: str
+    dst_ip: str
+    src_port: int
+    dst_port: int
+    seq_num: int
+    ack_num: int
+    flags: str
+    window: int
+    payload: bytes
+
+
+@dataclass(eq=False)
+class UDPPacket(Packet):
+    """A generated UDP packet."""
+    __slots__ = ('src_ip', 'dst_ip', 'src_port', 'dst_port', 'payload')
+    protocol: ClassVar[str] = 'UDP'
+    FIELDS: ClassVar[Tuple[str, ...]] = ('protocol',) + __slots__
+
+    src_ip: str
+    dst_ip: str
+    src_port: int
+    dst_port: int
+    payload: bytes
+
+
+@dataclass(eq=False)
+class ICMPPacket(Packet):
+    """A generated ICMP packet."""
+    __slots__ = ('src_ip', 'dst_ip', 'type', 'code', 'id', 'seq', 'payload')
+    protocol: ClassVar[str] = 'ICMP'
+    FIELDS: ClassVar[Tuple[str, ...]] = ('protocol',) + __slots__
+
+    src_ip: str
+    dst_ip: str
+    type: int
+    code: int
+    id: int
+    seq: int
+    payload: bytes
 
 
 class RandomPacket:
@@ -36,6 +154,13 @@ class RandomPacket:
     IP_PROTO_TCP = 6
     IP_PROTO_UDP = 17
     IP_PROTO_ICMP = 1
+
+    PROTOCOLS = (PROTOCOL_TCP, PROTOCOL_UDP, PROTOCOL_ICMP)
+    TCP_FLAGS = ('SYN', 'ACK', 'FIN', 'PSH', 'RST', 'SYN-ACK')
+    ICMP_TYPES = (0, 8)  # 0=Echo Reply, 8=Echo Request
+
+    # generate_packets builds batches at least this big from bulk columns
+    BULK_THRESHOLD = 256
     
     def __init__(self, seed: Optional[int] = None):
         """
@@ -44,8 +169,27 @@ class RandomPacket:
         Args:
             seed: Optional random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        # Own generator, so seeding neither touches nor depends on the
+        # global random state
+        self._rng = random.Random(seed)
+        # Bound once here rather than looked up on every field
+        self._randint = self._rng.randint
+        self._choice = self._rng.choice
+        self._getrandbits = self._rng.getrandbits
+
+    @classmethod
+    def from_name(cls, name: str) -> 'RandomPacket':
+        """
+        Create a generator seeded from a name.
+
+        The same name always yields the same packet stream, and different
+        names get unrelated streams.
+
+        Args:
+            name: Name to derive the seed from
+        """
+        digest = hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest()
+        return cls(seed=int.from_bytes(digest, 'big'))
     
     def generate_random_ip(self) -> str:
         """
@@ -57,11 +201,18 @@ class RandomPacket:
         Note: Excludes certain reserved addresses by using 1-254 range for
         first and last octets to avoid network/broadcast addresses.
         """
-        return f"{random.randint(1, 254)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+        getrandbits = self._getrandbits
+        # One 32-bit draw, redrawn in the rare (~1.6%) case an end octet
+        # lands on 0 or 255, then formatted in C by inet_ntoa
+        while True:
+            n = getrandbits(32)
+            first, last = n >> 24, n & 0xFF
+            if 0 < first < 255 and 0 < last < 255:
+                return inet_ntoa(n.to_bytes(4, 'big'))
     
     def generate_random_port(self) -> int:
         """Generate a random port number (1024-65535)."""
-        return random.randint(1024, 65535)
+        return self._randint(1024, 65535)
     
     def generate_random_payload(self, min_size: int = 0, max_size: int = 1500) -> bytes:
         """
@@ -74,12 +225,13 @@ class RandomPacket:
         Returns:
             Random bytes payload
         """
-        size = random.randint(min_size, max_size)
-        return bytes([random.randint(0, 255) for _ in range(size)])
+        size = self._randint(min_size, max_size)
+        # One big draw instead of a randint per byte
+        return _random_bytes(self._rng, size)
     
     def generate_tcp_packet(self, src_ip: Optional[str] = None, dst_ip: Optional[str] = None,
                            src_port: Optional[int] = None, dst_port: Optional[int] = None,
-                           payload_size: int = 100) -> Dict:
+                           payload_size: int = 100) -> TCPPacket:
         """
         Generate a random TCP packet.
         
@@ -91,25 +243,23 @@ class RandomPacket:
             payload_size: Size of payload data
             
         Returns:
-            Dictionary containing packet information
+            TCPPacket with the packet fields
         """
-        packet = {
-            'protocol': self.PROTOCOL_TCP,
-            'src_ip': src_ip or self.generate_random_ip(),
-            'dst_ip': dst_ip or self.generate_random_ip(),
-            'src_port': src_port or self.generate_random_port(),
-            'dst_port': dst_port or self.generate_random_port(),
-            'seq_num': random.randint(0, 2**32 - 1),
-            'ack_num': random.randint(0, 2**32 - 1),
-            'flags': random.choice(['SYN', 'ACK', 'FIN', 'PSH', 'RST', 'SYN-ACK']),
-            'window': random.randint(1024, 65535),
-            'payload': self.generate_random_payload(0, payload_size)
-        }
-        return packet
+        return TCPPacket(
+            src_ip=src_ip or self.generate_random_ip(),
+            dst_ip=dst_ip or self.generate_random_ip(),
+            src_port=src_port or self.generate_random_port(),
+            dst_port=dst_port or self.generate_random_port(),
+            seq_num=self._getrandbits(32),
+            ack_num=self._getrandbits(32),
+            flags=self._choice(self.TCP_FLAGS),
+            window=self._randint(1024, 65535),
+            payload=self.generate_random_payload(0, payload_size),
+        )
     
     def generate_udp_packet(self, src_ip: Optional[str] = None, dst_ip: Optional[str] = None,
                            src_port: Optional[int] = None, dst_port: Optional[int] = None,
-                           payload_size: int = 100) -> Dict:
+                           payload_size: int = 100) -> UDPPacket:
         """
         Generate a random UDP packet.
         
@@ -121,20 +271,18 @@ class RandomPacket:
             payload_size: Size of payload data
             
         Returns:
-            Dictionary containing packet information
+            UDPPacket with the packet fields
         """
-        packet = {
-            'protocol': self.PROTOCOL_UDP,
-            'src_ip': src_ip or self.generate_random_ip(),
-            'dst_ip': dst_ip or self.generate_random_ip(),
-            'src_port': src_port or self.generate_random_port(),
-            'dst_port': dst_port or self.generate_random_port(),
-            'payload': self.generate_random_payload(0, payload_size)
-        }
-        return packet
+        return UDPPacket(
+            src_ip=src_ip or self.generate_random_ip(),
+            dst_ip=dst_ip or self.generate_random_ip(),
+            src_port=src_port or self.generate_random_port(),
+            dst_port=dst_port or self.generate_random_port(),
+            payload=self.generate_random_payload(0, payload_size),
+        )
     
     def generate_icmp_packet(self, src_ip: Optional[str] = None, dst_ip: Optional[str] = None,
-                            payload_size: int = 64) -> Dict:
+                            payload_size: int = 64) -> ICMPPacket:
         """
         Generate a random ICMP packet.
         
@@ -144,21 +292,19 @@ class RandomPacket:
             payload_size: Size of payload data
             
         Returns:
-            Dictionary containing packet information
+            ICMPPacket with the packet fields
         """
-        packet = {
-            'protocol': self.PROTOCOL_ICMP,
-            'src_ip': src_ip or self.generate_random_ip(),
-            'dst_ip': dst_ip or self.generate_random_ip(),
-            'type': random.choice([0, 8]),  # 0=Echo Reply, 8=Echo Request
-            'code': 0,
-            'id': random.randint(0, 65535),
-            'seq': random.randint(0, 65535),
-            'payload': self.generate_random_payload(0, payload_size)
-        }
-        return packet
+        return ICMPPacket(
+            src_ip=src_ip or self.generate_random_ip(),
+            dst_ip=dst_ip or self.generate_random_ip(),
+            type=self._choice(self.ICMP_TYPES),
+            code=0,
+            id=self._getrandbits(16),
+            seq=self._getrandbits(16),
+            payload=self.generate_random_payload(0, payload_size),
+        )
     
-    def generate_random_packet(self, protocol: Optional[str] = None, **kwargs) -> Dict:
+    def generate_random_packet(self, protocol: Optional[str] = None, **kwargs) -> Packet:
         """
         Generate a random packet of any supported protocol.
         
@@ -167,10 +313,10 @@ class RandomPacket:
             **kwargs: Additional parameters to pass to protocol-specific generator
             
         Returns:
-            Dictionary containing packet information
+            Packet of the chosen protocol
         """
         if protocol is None:
-            protocol = random.choice([self.PROTOCOL_TCP, self.PROTOCOL_UDP, self.PROTOCOL_ICMP])
+            protocol = self._choice(self.PROTOCOLS)
         
         if protocol == self.PROTOCOL_TCP:
             return self.generate_tcp_packet(**kwargs)
@@ -181,7 +327,7 @@ class RandomPacket:
         else:
             raise ValueError(f"Unsupported protocol: {protocol}")
     
-    def generate_packets(self, count: int = 1, protocol: Optional[str] = None, **kwargs) -> List[Dict]:
+    def generate_packets(self, count: int = 1, protocol: Optional[str] = None, **kwargs) -> List[Packet]:
         """
         Generate multiple random packets.
         
@@ -191,43 +337,178 @@ class RandomPacket:
             **kwargs: Additional parameters to pass to packet generator
             
         Returns:
-            List of packet dictionaries
+            List of packets
+        """
+        generators = {
+            self.PROTOCOL_TCP: self.generate_tcp_packet,
+            self.PROTOCOL_UDP: self.generate_udp_packet,
+            self.PROTOCOL_ICMP: self.generate_icmp_packet,
+        }
+        if protocol is None:
+            # Every protocol drawn in one call, then dispatched by lookup
+            protocols = self._rng.choices(self.PROTOCOLS, k=count)
+        elif protocol in generators:
+            protocols = (protocol,) * count
+        else:
+            raise ValueError(f"Unsupported protocol: {protocol}")
+        if count >= self.BULK_THRESHOLD and set(kwargs) <= {'payload_size'}:
+            return self._generate_packets_bulk(protocols, **kwargs)
+        return [generators[p](**kwargs) for p in protocols]
+
+    def _generate_packets_bulk(self, protocols, payload_size: Optional[int] = None) -> List[Packet]:
+        """generate_packets for large batches, built from per-protocol columns."""
+        batches = {}
+        for protocol in self.PROTOCOLS:
+            n = protocols.count(protocol)
+            if n:
+                # Same default sizes as the per-protocol generators
+                size = payload_size if payload_size is not None else (
+                    64 if protocol == self.PROTOCOL_ICMP else 100)
+                batches[protocol] = packets_from_arrays(self.generate_packets_arrays(n, protocol, size))
+        if len(batches) == 1:
+            return batches.popitem()[1]
+        iters = {protocol: iter(batch) for protocol, batch in batches.items()}
+        return [next(iters[p]) for p in protocols]
+
+    def generate_random_ips(self, count: int) -> array:
+        """
+        Generate count random IPs as 32-bit ints (network byte order values).
+
+        Same ranges as generate_random_ip, drawn in bulk.
+        """
+        rng = self._rng
+        ends = _random_octets(rng, 2 * count)
+        buf = bytearray(4 * count)
+        buf[0::4] = ends[:count]
+        buf[1::4] = _random_bytes(rng, count)
+        buf[2::4] = _random_bytes(rng, count)
+        buf[3::4] = ends[count:]
+        ips = array('I', bytes(buf))
+        if sys.byteorder == 'little':
+            ips.byteswap()
+        return ips
+
+    def generate_packets_arrays(self, count: int, protocol: str = PROTOCOL_TCP,
+                                payload_size: int = 100) -> Dict:
+        """
+        Generate count packets of one protocol as columns instead of dicts.
+
+        Every field is drawn in bulk into an array, one per packet field,
+        which is much faster than generate_packets for large counts.
+        Payloads are concatenated into one bytes object; packet i's payload
+        is payloads[offsets[i]:offsets[i + 1]].
+
+        Args:
+            count: Number of packets to generate
+            protocol: TCP, UDP or ICMP
+            payload_size: Maximum payload size in bytes
+
+        Returns:
+            Dictionary of field name -> array (plus 'protocol' and 'payloads')
         """
-        return [self.generate_random_packet(protocol, **kwargs) for _ in range(count)]
+        if protocol not in self.PROTOCOLS:
+            raise ValueError(f"Unsupported protocol: {protocol}")
+
+        rng = self._rng
+        columns = {
+            'protocol': protocol,
+            'src_ip': self.generate_random_ips(count),
+            'dst_ip': self.generate_random_ips(count),
+        }
+        if protocol == self.PROTOCOL_ICMP:
+            columns['type'] = array('B', rng.choices(self.ICMP_TYPES, k=count))
+            columns['code'] = array('B', bytes(count))
+            columns['id'] = _random_u16(rng, count)
+            columns['seq'] = _random_u16(rng, count)
+        else:
+            columns['src_port'] = _random_u16(rng, count, 1024)
+            columns['dst_port'] = _random_u16(rng, count, 1024)
+            if protocol == self.PROTOCOL_TCP:
+                columns['seq_num'] = array('I', _random_bytes(rng, 4 * count))
+                columns['ack_num'] = array('I', _random_bytes(rng, 4 * count))
+                columns['flags'] = rng.choices(self.TCP_FLAGS, k=count)
+                columns['window'] = _random_u16(rng, count, 1024)
 
+        sizes = rng.choices(range(payload_size + 1), k=count)
+        offsets = array('L', [0])
+        offsets.extend(accumulate(sizes))
+        columns['offsets'] = offsets
+        columns['payloads'] = _random_bytes(rng, offsets[-1])
+        return columns
 
-def format_packet(packet: Dict) -> str:
+
+_PACKET_TYPES = {cls.protocol: cls for cls in (TCPPacket, UDPPacket, ICMPPacket)}
+
+
+def packet_at(columns: Dict, i: int) -> Packet:
+    """
+    Build packet i of a generate_packets_arrays result as a packet record.
+
+    Only the requested row is materialized, so columns can stay the
+    storage format and records are made on demand for display or export.
     """
-    Format a packet dictionary as a human-readable string.
+    cls = _PACKET_TYPES[columns['protocol']]
+    offsets = columns['offsets']
+    values = {}
+    for name in cls.__slots__:
+        if name == 'payload':
+            values[name] = columns['payloads'][offsets[i]:offsets[i + 1]]
+        elif name.endswith('_ip'):
+            values[name] = inet_ntoa(columns[name][i].to_bytes(4, 'big'))
+        else:
+            values[name] = columns[name][i]
+    return cls(**values)
+
+
+def packets_from_arrays(columns: Dict) -> List[Packet]:
+    """Build every row of a generate_packets_arrays result as packet records."""
+    cls = _PACKET_TYPES[columns['protocol']]
+    payloads, offsets = columns['payloads'], columns['offsets']
+    fields = []
+    for name in cls.__slots__:
+        if name == 'payload':
+            fields.append([payloads[a:b] for a, b in zip(offsets, offsets[1:])])
+        elif name.endswith('_ip'):
+            fields.append([inet_ntoa(n.to_bytes(4, 'big')) for n in columns[name]])
+        else:
+            fields.append(columns[name])
+    return list(map(cls, *fields))
+
+
+def _packet_format(fields: Tuple[Tuple[str, str], ...]) -> Tuple[str, Any, Any]:
+    """A format_packet template plus attribute and key getters for its fields."""
+    names = [name for name, _ in fields]
+    template = "".join(f"{label}: %s\n" for _, label in fields) + "Payload Size: %d bytes"
+    return template, attrgetter(*names, 'payload'), itemgetter(*names, 'payload')
+
+
+_FORMAT_HEAD = (('protocol', 'Protocol'), ('src_ip', 'Source'), ('dst_ip', 'Destination'))
+_FORMAT_PORTS = (('src_port', 'Source Port'), ('dst_port', 'Destination Port'))
+# One precompiled template per protocol, so formatting is a single % operation
+_PACKET_FORMATS = {
+    RandomPacket.PROTOCOL_TCP: _packet_format(
+        _FORMAT_HEAD + _FORMAT_PORTS + (('seq_num', 'Sequence'), ('ack_num', 'Acknowledgment'),
+                                        ('flags', 'Flags'), ('window', 'Window'))),
+    RandomPacket.PROTOCOL_UDP: _packet_format(_FORMAT_HEAD + _FORMAT_PORTS),
+    RandomPacket.PROTOCOL_ICMP: _packet_format(
+        _FORMAT_HEAD + (('type', 'Type'), ('code', 'Code'), ('id', 'ID'), ('seq', 'Sequence'))),
+}
+_FALLBACK_FORMAT = _packet_format(_FORMAT_HEAD)
+
+
+def format_packet(packet: Packet) -> str:
+    """
+    Format a packet as a human-readable string.
     
     Args:
-        packet: Packet dictionary
+        packet: Packet (or a dict with the same keys)
         
     Returns:
         Formatted string representation
     """
-    lines = [f"Protocol: {packet['protocol']}"]
-    lines.append(f"Source: {packet['src_ip']}")
-    lines.append(f"Destination: {packet['dst_ip']}")
-    
-    if 'src_port' in packet:
-        lines.append(f"Source Port: {packet['src_port']}")
-    if 'dst_port' in packet:
-        lines.append(f"Destination Port: {packet['dst_port']}")
-    
-    if packet['protocol'] == RandomPacket.PROTOCOL_TCP:
-        lines.append(f"Sequence: {packet['seq_num']}")
-        lines.append(f"Acknowledgment: {packet['ack_num']}")
-        lines.append(f"Flags: {packet['flags']}")
-        lines.append(f"Window: {packet['window']}")
-    elif packet['protocol'] == RandomPacket.PROTOCOL_ICMP:
-        lines.append(f"Type: {packet['type']}")
-        lines.append(f"Code: {packet['code']}")
-        lines.append(f"ID: {packet['id']}")
-        lines.append(f"Sequence: {packet['seq']}")
-    
-    lines.append(f"Payload Size: {len(packet['payload'])} bytes")
-    return "\n".join(lines)
+    template, get_attrs, get_items = _PACKET_FORMATS.get(packet['protocol'], _FALLBACK_FORMAT)
+    *values, payload = get_attrs(packet) if isinstance(packet, Packet) else get_items(packet)
+    return template % (*values, len(payload))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the quadcore pane helpers (the segmented sieve).
+"""
+
+import unittest
+from itertools import islice
+from modes._pane_helpers import (
+    WHEEL_PERIOD, small_primes, segmented_sieve, segment_stats,
+    extend_base_primes, prime_batches,
+)
+
+
+def brute_primes(low, high):
+    """Primes in [low, high) by trial division."""
+    return [n for n in range(max(low, 2), high)
+            if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+
+
+class TestPaneHelpers(unittest.TestCase):
+    """Test cases for the segmented sieve helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.base_primes = small_primes(200)
+
+    def test_small_primes(self):
+        """Test the odd base primes against trial division."""
+        for limit in (0, 2, 3, 4, 9, 10, 11, 105, 211):
+            self.assertEqual(small_primes(limit), brute_primes(3, limit + 1))
+
+    def test_segmented_sieve_small_ranges(self):
+        """Test ranges starting at 0-10, where 2 and the wheel primes live."""
+        for low in range(11):
+            for high in range(low, 60):
+                self.assertEqual(segmented_sieve(low, high, self.base_primes),
+                                 brute_primes(low, high), (low, high))
+
+    def test_segmented_sieve_across_wheel_periods(self):
+        """Test unaligned ranges crossing the 105-odd wheel period."""
+        span = 2 * WHEEL_PERIOD
+        for low in (209, 210, 211, 1000, 1051, 4409, 9999):
+            for size in (1, 2, 7, span - 1, span, span + 1, 3 * span + 5):
+                high = low + size
+                self.assertEqual(segmented_sieve(low, high, self.base_primes),
+                                 brute_primes(low, high), (low, high))
+
+    def test_segment_stats(self):
+        """Test the count and largest prime read off the sieve."""
+        for low, high in ((0, 2), (0, 3), (2, 3), (0, 100), (24, 28), (1000, 1500), (9970, 10000)):
+            primes = brute_primes(low, high)
+            self.assertEqual(segment_stats(low, high, self.base_primes),
+                             (len(primes), primes[-1] if primes else 0), (low, high))
+
+    def test_extend_base_primes(self):
+        """Test growing the base primes, both by extending and by starting over."""
+        base_primes = []
+        limit = 0
+        for target in (10, 11, 50, 51, 1000, 1001, 5000):
+            limit = extend_base_primes(base_primes, limit, target)
+            self.assertGreaterEqual(limit, target)
+            self.assertEqual(base_primes, brute_primes(3, limit + 1))
+
+    def test_prime_batches(self):
+        """Test consecutive batches across several base-prime regrows."""
+        high, total, largest = 2, 0, 0
+        for high, count, largest in islice(prime_batches(batch_size=97), 200):
+            total += count
+        primes = brute_primes(2, high)
+        self.assertEqual(total, len(primes))
+        self.assertEqual(largest, primes[-1])
+
+    def test_prime_batches_unaligned_start(self):
+        """Test batches starting mid-range, from an odd and an even number."""
+        for start in (1, 1000, 1001):
+            batches = islice(prime_batches(start=start, batch_size=50), 30)
+            for high, count, largest in batches:
+                primes = brute_primes(high - 50, high)
+                self.assertEqual((count, largest), (len(primes), primes[-1] if primes else 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
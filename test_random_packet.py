@@ -4,7 +4,7 @@ Unit tests for the Random Packet Generator.
 """
 
 import unittest
-from random_packet import RandomPacket, format_packet
+from random_packet import RandomPacket, format_packet, packet_at
 
 
 class TestRandomPacket(unittest.TestCase):
@@ -151,10 +151,10 @@ class TestRandomPacket(unittest.TestCase):
     def test_seeded_generation_reproducibility(self):
         """Test that seeded generation is reproducible."""
         # Generate multiple packets with same seed to verify reproducibility
-        gen1 = RandomPacket(seed=12345)
+        gen1 = RandomPacket.from_name('reproducibility-test-1')
         packets1 = gen1.generate_packets(count=3)
         
-        gen2 = RandomPacket(seed=12345)
+        gen2 = RandomPacket.from_name('reproducibility-test-1')
         packets2 = gen2.generate_packets(count=3)
         
         # Check that the same sequence is generated
@@ -163,6 +163,79 @@ class TestRandomPacket(unittest.TestCase):
             self.assertEqual(p1['src_ip'], p2['src_ip'])
             self.assertEqual(p1['dst_ip'], p2['dst_ip'])
     
+    def test_from_name(self):
+        """Test that different names give different streams."""
+        payload1 = RandomPacket.from_name('a').generate_random_payload(100, 200)
+        payload2 = RandomPacket.from_name('b').generate_random_payload(100, 200)
+        self.assertNotEqual(payload1, payload2)
+
+    def test_seeded_payload_ignores_global_random(self):
+        """Test that seeded payloads don't depend on the global random state."""
+        import random
+        payload1 = RandomPacket(seed=7).generate_random_payload(100, 200)
+        random.random()
+        payload2 = RandomPacket(seed=7).generate_random_payload(100, 200)
+        self.assertEqual(payload1, payload2)
+
+    def test_packet_record(self):
+        """Test that packets are slotted records that still read like dicts."""
+        packet = self.generator.generate_udp_packet()
+        self.assertFalse(hasattr(packet, '__dict__'))
+        self.assertEqual(packet['src_ip'], packet.src_ip)
+        self.assertNotIn('seq_num', packet)
+        self.assertIsNone(packet.get('seq_num'))
+        with self.assertRaises(KeyError):
+            packet['seq_num']
+        self.assertEqual(list(packet.asdict()),
+                         ['protocol', 'src_ip', 'dst_ip', 'src_port', 'dst_port', 'payload'])
+
+    def test_packet_mapping(self):
+        """Test that packets iterate and compare like the old dict packets."""
+        packet = self.generator.generate_udp_packet()
+        self.assertEqual(list(packet), list(packet.FIELDS))
+        self.assertEqual(len(packet), 6)
+        self.assertEqual(dict(packet.items()), packet.asdict())
+        self.assertEqual(list(packet.values())[0], RandomPacket.PROTOCOL_UDP)
+        self.assertEqual(dict(packet), packet.asdict())
+        self.assertEqual(packet, packet.asdict())
+
+    def test_generate_packets_arrays(self):
+        """Test bulk column generation."""
+        columns = self.generator.generate_packets_arrays(200, payload_size=50)
+        self.assertEqual(columns['protocol'], RandomPacket.PROTOCOL_TCP)
+        for name in ('src_ip', 'dst_ip', 'src_port', 'dst_port', 'seq_num', 'ack_num', 'flags', 'window'):
+            self.assertEqual(len(columns[name]), 200)
+        for ip in columns['src_ip']:
+            self.assertTrue(1 <= ip >> 24 <= 254)
+            self.assertTrue(1 <= ip & 0xFF <= 254)
+        self.assertTrue(all(1024 <= port <= 65535 for port in columns['dst_port']))
+        offsets = columns['offsets']
+        self.assertEqual(len(offsets), 201)
+        self.assertEqual(offsets[-1], len(columns['payloads']))
+        self.assertTrue(all(0 <= b - a <= 50 for a, b in zip(offsets, offsets[1:])))
+
+    def test_packet_at(self):
+        """Test building a record from a row of columns."""
+        columns = self.generator.generate_packets_arrays(10, protocol='ICMP')
+        packet = packet_at(columns, 3)
+        self.assertEqual(packet['protocol'], RandomPacket.PROTOCOL_ICMP)
+        self.assertEqual(packet.src_ip.count('.'), 3)
+        self.assertEqual(packet.seq, columns['seq'][3])
+        self.assertEqual(packet.payload, columns['payloads'][columns['offsets'][3]:columns['offsets'][4]])
+        self.assertIn('Protocol: ICMP', format_packet(packet))
+
+    def test_generate_packets_bulk(self):
+        """Test that large batches match the per-packet generators' shape."""
+        count = RandomPacket.BULK_THRESHOLD
+        packets = self.generator.generate_packets(count=count)
+        self.assertEqual(len(packets), count)
+        self.assertEqual({p['protocol'] for p in packets}, set(RandomPacket.PROTOCOLS))
+        for packet in packets:
+            self.assertTrue(len(packet['payload']) <= 100)
+            self.assertEqual(packet['src_ip'].count('.'), 3)
+        again = RandomPacket(seed=42).generate_packets(count=count)
+        self.assertEqual(packets, again)
+
     def test_invalid_protocol(self):
         """Test that invalid protocol raises ValueError."""
         with self.assertRaises(ValueError):
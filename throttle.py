@@ -13,12 +13,17 @@ point of privacy if you can't watch cat videos in peace?
 import asyncio
 import time
 import os
+import re
 import sys
 from dataclasses import dataclass, field
 from typing import Optional, Callable, List, Dict
 from datetime import datetime, timedelta
 from collections import deque
 
+# One /proc/net/dev interface line: name, then rx bytes (field 1) and
+# tx bytes (field 9)
+_NET_DEV_LINE = re.compile(rb'^\s*([^:\s]+):\s*(\d+)(?:\s+\d+){7}\s+(\d+)', re.M)
+
 
 @dataclass
 class ResourceLimits:
@@ -56,6 +61,9 @@ class BandwidthMonitor:
     from your housemates."
     """
 
+    # Upper bound on transfer_log entries, however fast transfers arrive
+    MAX_LOG_ENTRIES = 1024
+
     def __init__(self, max_kbps: int = 500, window_seconds: float = 1.0):
         """
         Initialize the bandwidth monitor.
@@ -67,35 +75,49 @@ class BandwidthMonitor:
         self.max_kbps = max_kbps
         self.max_bytes_per_window = (max_kbps * 1024) * window_seconds
         self.window_seconds = window_seconds
+        # Worked out once for the per-request checks
+        self._throttle_threshold = max_kbps * 0.9
+        self._seconds_per_byte = 1.0 / (max_kbps * 1024) if max_kbps else 0.0
 
         # Track bytes transferred in sliding window
         self.transfer_log: deque = deque()
         self.total_bytes = 0
+        # Sum of the bytes in transfer_log, kept in step with it
+        self._window_bytes = 0
 
     def record_transfer(self, bytes_count: int) -> None:
         """Record a data transfer."""
-        now = time.time()
-        self.transfer_log.append((now, bytes_count))
+        now = time.monotonic()
         self.total_bytes += bytes_count
+        self._window_bytes += bytes_count
 
         # Clean old entries
         self._cleanup_old_entries(now)
 
+        log = self.transfer_log
+        if len(log) >= self.MAX_LOG_ENTRIES:
+            # Fold the oldest entry into the next one rather than dropping
+            # it, so no bytes go missing and they only age out later
+            _, oldest_bytes = log.popleft()
+            next_time, next_bytes = log[0]
+            log[0] = (next_time, next_bytes + oldest_bytes)
+        log.append((now, bytes_count))
+
     def _cleanup_old_entries(self, now: float) -> None:
         """Remove entries outside the window."""
         cutoff = now - self.window_seconds
         while self.transfer_log and self.transfer_log[0][0] < cutoff:
-            self.transfer_log.popleft()
+            self._window_bytes -= self.transfer_log.popleft()[1]
 
     def get_current_bandwidth(self) -> float:
         """Get current bandwidth usage in KB/s."""
-        now = time.time()
+        now = time.monotonic()
         self._cleanup_old_entries(now)
 
         if not self.transfer_log:
             return 0.0
 
-        total_bytes = sum(b for _, b in self.transfer_log)
+        total_bytes = self._window_bytes
         elapsed = now - self.transfer_log[0][0] if self.transfer_log else self.window_seconds
 
         if elapsed > 0:
@@ -104,12 +126,19 @@ class BandwidthMonitor:
 
     def should_throttle(self) -> bool:
         """Check if we should slow down."""
-        return self.get_current_bandwidth() > self.max_kbps * 0.9
+        return self.get_current_bandwidth() > self._throttle_threshold
 
     async def wait_for_bandwidth(self) -> None:
         """Wait until bandwidth is available."""
         while self.should_throttle():
-            await asyncio.sleep(0.1)
+            # Sleep straight to the point where the rate falls back under
+            # the threshold: either the window has stretched far enough,
+            # or the oldest entry ages out, whichever comes first.
+            oldest = self.transfer_log[0][0]
+            resume = oldest + self.window_seconds
+            if self._throttle_threshold > 0:
+                resume = min(resume, oldest + self._window_bytes / (self._throttle_threshold * 1024))
+            await asyncio.sleep(max(0.0, resume - time.monotonic()))
 
     def get_delay_for_transfer(self, bytes_count: int) -> float:
         """Calculate delay needed before a transfer."""
@@ -121,7 +150,7 @@ class BandwidthMonitor:
         # If we're at or above limit, calculate wait time
         if current_rate >= self.max_kbps:
             # Wait for enough bandwidth to free up
-            return (bytes_count / 1024) / self.max_kbps
+            return bytes_count * self._seconds_per_byte
 
         return 0.0
 
@@ -152,20 +181,23 @@ class RateLimiter:
         self.burst_limit = burst_limit
         self.burst_window = burst_window
 
-        self.last_request_time = 0.0
-        self.request_times: deque = deque()
+        # The monotonic clock has no fixed epoch; start far enough back that
+        # the first request never waits on min_interval
+        self.last_request_time = float("-inf")
+        # acquire() never lets this grow past burst_limit
+        self.request_times: deque = deque(maxlen=max(burst_limit, 1))
         self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
         """Acquire permission to make a request."""
         async with self._lock:
-            now = time.time()
+            now = time.monotonic()
 
             # Check minimum interval
             time_since_last = now - self.last_request_time
             if time_since_last < self.min_interval:
                 await asyncio.sleep(self.min_interval - time_since_last)
-                now = time.time()
+                now = time.monotonic()
 
             # Check burst limit
             self._cleanup_old_requests(now)
@@ -174,7 +206,7 @@ class RateLimiter:
                 wait_time = self.request_times[0] + self.burst_window - now
                 if wait_time > 0:
                     await asyncio.sleep(wait_time)
-                now = time.time()
+                now = time.monotonic()
                 self._cleanup_old_requests(now)
 
             # Record this request
@@ -210,8 +242,14 @@ class UserActivityDetector:
         self.threshold = threshold
         self.sample_interval = sample_interval
         self.our_bytes = 0
-        self._last_check = time.time()
+        self._last_check = time.monotonic()
         self._network_baseline: Optional[Dict] = None
+        # /proc/net/dev, opened on first use and kept open between samples
+        self._net_dev_fd: Optional[int] = None
+
+    def __del__(self):
+        if self._net_dev_fd is not None:
+            os.close(self._net_dev_fd)
 
     def record_our_transfer(self, bytes_count: int) -> None:
         """Record bytes transferred by our tool."""
@@ -250,20 +288,28 @@ class UserActivityDetector:
     def _get_network_stats(self) -> Optional[Dict]:
         """Get network statistics (Linux only)."""
         try:
-            with open('/proc/net/dev', 'r') as f:
-                lines = f.readlines()
+            if self._net_dev_fd is None:
+                self._net_dev_fd = os.open('/proc/net/dev', os.O_RDONLY)
+            fd = self._net_dev_fd
+
+            # Rewind and re-read the same fd; procfs regenerates the file
+            os.lseek(fd, 0, os.SEEK_SET)
+            chunks = []
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
 
             total_rx = 0
             total_tx = 0
 
-            for line in lines[2:]:  # Skip headers
-                parts = line.split()
-                if len(parts) >= 10:
-                    # Skip loopback
-                    if parts[0].startswith('lo'):
-                        continue
-                    total_rx += int(parts[1])
-                    total_tx += int(parts[9])
+            for name, rx, tx in _NET_DEV_LINE.findall(b''.join(chunks)):
+                # Skip loopback
+                if name.startswith(b'lo'):
+                    continue
+                total_rx += int(rx)
+                total_tx += int(tx)
 
             return {'rx': total_rx, 'tx': total_tx}
 
@@ -304,6 +350,9 @@ class ThrottledClient:
         ) if self.limits.yield_to_user else None
 
         self._client = httpx_client
+        # Caps in-flight requests; made on first use so it belongs to the
+        # running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
         self.stats = {
             "requests": 0,
             "bytes_transferred": 0,
@@ -313,10 +362,19 @@ class ThrottledClient:
 
     async def _ensure_client(self):
         """Ensure httpx client exists."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limits.max_concurrent_requests)
         if self._client is None:
             try:
                 import httpx
-                self._client = httpx.AsyncClient(timeout=30.0)
+                max_concurrent = self.limits.max_concurrent_requests
+                self._client = httpx.AsyncClient(
+                    timeout=30.0,
+                    limits=httpx.Limits(
+                        max_connections=max_concurrent,
+                        max_keepalive_connections=max_concurrent,
+                    ),
+                )
             except ImportError:
                 raise ImportError("httpx is required. Install with: pip install httpx")
 
@@ -349,10 +407,12 @@ class ThrottledClient:
 
         # Make request
         try:
-            response = await self._client.get(url, **kwargs)
+            async with self._semaphore:
+                response = await self._client.get(url, **kwargs)
 
-            # Record transfer
-            content_length = len(response.content) if hasattr(response, 'content') else 0
+            # Record transfer: bytes actually read off the wire (compressed),
+            # which is what counts against bandwidth and needs no body access
+            content_length = getattr(response, 'num_bytes_downloaded', 0)
             self.bandwidth_monitor.record_transfer(content_length)
             if self.activity_detector:
                 self.activity_detector.record_our_transfer(content_length)
@@ -436,9 +496,9 @@ if __name__ == "__main__":
 
         print("\nMaking throttled requests...")
         for url in test_urls:
-            start = time.time()
+            start = time.monotonic()
             response = await client.fetch(url)
-            elapsed = time.time() - start
+            elapsed = time.monotonic() - start
             if response:
                 print(f"  {url}: {response.status_code} ({elapsed:.2f}s)")
             else:
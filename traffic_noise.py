@@ -20,20 +20,24 @@ Not responsible for any existential crises caused to tracking scripts.
 import asyncio
 import argparse
 import random
-import string
 import hashlib
 import socket
 import signal
 import sys
 import re
+import time
+import weakref
+from html import unescape
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, List, Deque
+from typing import Callable, Optional, List, Deque
 from collections import deque
 from contextlib import suppress
+from functools import lru_cache, partial
+from itertools import islice
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from rich.console import Console
 from rich.live import Live
 from rich.table import Table
@@ -43,6 +47,43 @@ from rich.text import Text
 from rich.style import Style
 from rich import box
 
+# lxml is in requirements.txt, but don't lose headlines entirely without it
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# HTTP/2 needs the h2 package (httpx[http2]); plain HTTP/1.1 works without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Optional: aiohttp holds up better than httpx under many concurrent small
+# GETs, so workers fetch through it when installed
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional: uvloop's libuv event loop (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Optional: selectolax's Lexbor parser is much lighter than BeautifulSoup
+# for pulling out heading text; BeautifulSoup is used if it's missing
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -59,6 +100,7 @@ class Config:
     interface: str = "eth0"
     quiet: bool = False
     max_headlines: int = 3
+    seed: Optional[str] = None  # run name; makes worker behavior reproducible
 
 # Timing ranges
 MIN_DELAY = 3
@@ -67,12 +109,16 @@ MIN_SESSION = 60
 MAX_SESSION = 300
 CHAOS_MIN_DELAY = 1
 CHAOS_MAX_DELAY = 120
+# The news site list is fixed, so resolved hosts can be cached for a while
+DNS_CACHE_TTL = 600
+# Headlines sit near the top of a page; stop downloading news pages after this
+MAX_PAGE_BYTES = 256 * 1024
 
 # ============================================================================
 # USER AGENTS
 # ============================================================================
 
-USER_AGENTS = [
+USER_AGENTS = (
     # Windows Chrome
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -114,13 +160,13 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
     "Mozilla/4.0 (compatible; MSIE 8.0; Windows NT 6.1; Trident/4.0)",  # Grandma's computer still works
     "Mozilla/5.0 (Windows NT 5.1; rv:52.0) Gecko/20100101 Firefox/52.0",  # XP never dies
-]
+)
 
 # ============================================================================
 # DNS SERVERS
 # ============================================================================
 
-DNS_SERVERS = [
+DNS_SERVERS = (
     "8.8.8.8", "8.8.4.4",           # Google
     "1.1.1.1", "1.0.0.1",           # Cloudflare
     "9.9.9.9", "149.112.112.112",   # Quad9
@@ -128,22 +174,22 @@ DNS_SERVERS = [
     "64.6.64.6", "64.6.65.6",       # Verisign
     "185.228.168.9",                # CleanBrowsing
     "94.140.14.14",                 # AdGuard
-]
+)
 
 # ============================================================================
 # NEWS SITES BY CATEGORY
 # ============================================================================
 
 NEWS_SITES = {
-    "Lifestyle": [
+    "Lifestyle": (
         "https://www.buzzfeed.com",
         "https://www.huffpost.com/life",
         "https://www.refinery29.com",
         "https://www.goodhousekeeping.com",
         "https://www.allrecipes.com",
         "https://www.foodnetwork.com",
-    ],
-    "World": [
+    ),
+    "World": (
         "https://www.bbc.com/news/world",
         "https://www.reuters.com/world",
         "https://www.aljazeera.com",
@@ -152,8 +198,8 @@ NEWS_SITES = {
         "https://www.france24.com/en",
         "https://www.dw.com/en",
         "https://www.npr.org/sections/world",
-    ],
-    "Technology": [
+    ),
+    "Technology": (
         "https://www.theverge.com",
         "https://techcrunch.com",
         "https://arstechnica.com",
@@ -161,36 +207,39 @@ NEWS_SITES = {
         "https://www.cnet.com",
         "https://www.engadget.com",
         "https://www.zdnet.com",
-    ],
-    "Health": [
+    ),
+    "Health": (
         "https://www.webmd.com",
         "https://www.healthline.com",
         "https://www.medicalnewstoday.com",
         "https://www.health.com",
         "https://www.prevention.com",
-    ],
-    "Trending": [
+    ),
+    "Trending": (
         "https://news.google.com",
         "https://www.reddit.com/r/news",
         "https://news.ycombinator.com",
         "https://www.usatoday.com",
         "https://www.nbcnews.com",
         "https://www.cnn.com",
-    ],
+    ),
 }
 
+# Categories are picked uniformly, then a site within the category
+NEWS_CATEGORIES = tuple(NEWS_SITES)
+
 # ============================================================================
 # FINGERPRINT VARIATIONS
 # ============================================================================
 
-LANGUAGES = [
+LANGUAGES = (
     "en-US,en;q=0.9", "en-GB,en;q=0.9", "en-US,en;q=0.9,es;q=0.8",
     "es-ES,es;q=0.9,en;q=0.8", "fr-FR,fr;q=0.9,en;q=0.8",
     "de-DE,de;q=0.9,en;q=0.8", "pt-BR,pt;q=0.9,en;q=0.8",
     "ja-JP,ja;q=0.9,en;q=0.8", "zh-CN,zh;q=0.9,en;q=0.8",
-]
+)
 
-REFERERS = [
+REFERERS = (
     "https://www.google.com/",
     "https://www.bing.com/",
     "https://duckduckgo.com/",
@@ -198,19 +247,31 @@ REFERERS = [
     "https://twitter.com/",
     "https://www.reddit.com/",
     "",  # Direct
-]
+)
 
-ACCEPT_HEADERS = [
+ACCEPT_HEADERS = (
     "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
     "*/*",
-]
+)
+
+ENCODINGS = ("gzip, deflate, br", "gzip, deflate", "gzip")
 
-ENCODINGS = ["gzip, deflate, br", "gzip, deflate", "gzip"]
+PLATFORMS = ("Windows", "macOS", "Linux", "Android", "iOS")
 
-PLATFORMS = ["Windows", "macOS", "Linux", "Android", "iOS"]
+# Per-request optional headers and their relative odds; None leaves it out
+CONNECTIONS = ("keep-alive", "close")
+DNT_OPTIONS = (None, "0", "1")
+DNT_WEIGHTS = (6, 7, 7)  # 30% absent
+CACHE_CONTROL_OPTIONS = (None, "max-age=0", "no-cache", "no-store")
+CACHE_CONTROL_WEIGHTS = (3, 1, 1, 1)  # 50% absent
+# (Sec-CH-UA-Mobile, Sec-CH-UA-Platform) pairs
+SEC_CH_OPTIONS = (None,) + tuple(
+    (f"?{mobile}", f'"{platform}"') for mobile in (0, 1) for platform in PLATFORMS
+)
+SEC_CH_WEIGHTS = (len(SEC_CH_OPTIONS) - 1,) + (1,) * (len(SEC_CH_OPTIONS) - 1)  # 50% absent
 
-BROWSING_PATTERNS = ["normal", "bursty", "slow", "erratic", "scanner"]
+BROWSING_PATTERNS = ("normal", "bursty", "slow", "erratic", "scanner")
 
 # ============================================================================
 # GLOBAL STATE
@@ -219,6 +280,7 @@ BROWSING_PATTERNS = ["normal", "bursty", "slow", "erratic", "scanner"]
 @dataclass
 class AppState:
     headlines: Deque[dict] = field(default_factory=lambda: deque(maxlen=10))
+    headline_version: int = 0  # bumped whenever headlines changes
     request_count: int = 0
     start_time: datetime = field(default_factory=datetime.now)
     workers_active: int = 0
@@ -229,80 +291,153 @@ class AppState:
 
 console = Console()
 state = AppState()
+# Per layout: what each dashboard section was last drawn from, so unchanged
+# ones are skipped. Keyed by layout so a fresh one always gets a full draw.
+_drawn: "weakref.WeakKeyDictionary[Layout, dict]" = weakref.WeakKeyDictionary()
+
+def _changed(layout: Layout, section: str, key) -> bool:
+    """True (and remembered) if section's content key differs from its last draw."""
+    drawn = _drawn.setdefault(layout, {})
+    if section in drawn and drawn[section] == key:
+        return False
+    drawn[section] = key
+    return True
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def generate_session_id() -> str:
+# Fallback generator for callers that don't bring their own
+_rng = random.Random()
+
+def generate_session_id(rng: Optional[random.Random] = None) -> str:
     """Generate a session ID that looks legit but is totally fake.
     Like my confidence during code reviews."""
-    return ''.join(random.choices(string.hexdigits.lower(), k=32))
-
-def generate_mac() -> str:
-    return ':'.join([
-        format((random.randint(0, 255) & 0xFE) | 0x02, '02x'),
-        *[format(random.randint(0, 255), '02x') for _ in range(5)]
-    ])
-
-def get_random_news_url() -> tuple[str, str]:
-    category = random.choice(list(NEWS_SITES.keys()))
-    url = random.choice(NEWS_SITES[category])
+    return f"{(rng or _rng).getrandbits(128):032x}"
+
+def generate_mac(rng: Optional[random.Random] = None) -> str:
+    # First octet: unicast (bit 0 clear), locally administered (bit 1 set)
+    mac = ((rng or _rng).getrandbits(48) & ~(1 << 40)) | (1 << 41)
+    return mac.to_bytes(6, 'big').hex(':')
+
+def derive_worker_seed(run_name: str, worker_id: int) -> int:
+    """Seed for one worker: reproducible per run name, independent per worker."""
+    digest = hashlib.blake2b(f"{run_name}:{worker_id}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+def get_random_news_url(rng: Optional[random.Random] = None) -> tuple[str, str]:
+    rng = rng or _rng
+    category = rng.choice(NEWS_CATEGORIES)
+    url = rng.choice(NEWS_SITES[category])
     return category, url
 
-def get_pattern_delay(pattern: str, chaos: bool = False) -> float:
+# Delay range per browsing pattern; "bursty" is handled separately
+PATTERN_DELAYS = {
+    "normal": (5, 30),
+    "slow": (45, 180),
+    "erratic": (1, 120),
+    "scanner": (1, 5),
+}
+
+def pattern_delay_sampler(pattern: str, chaos: bool = False,
+                          rng: Optional[random.Random] = None) -> Callable[[], float]:
+    """A no-argument function returning delays for pattern, to bind once per worker."""
+    uniform = (rng or _rng).uniform
     if chaos:
-        return random.uniform(CHAOS_MIN_DELAY, CHAOS_MAX_DELAY)
-
-    delays = {
-        "normal": (5, 30),
-        "bursty": (1, 3) if random.random() < 0.7 else (30, 90),
-        "slow": (45, 180),
-        "erratic": (1, 120),
-        "scanner": (1, 5),
-    }
-    min_d, max_d = delays.get(pattern, (MIN_DELAY, MAX_DELAY))
-    return random.uniform(min_d, max_d)
+        return partial(uniform, CHAOS_MIN_DELAY, CHAOS_MAX_DELAY)
+    if pattern == "bursty":
+        # Mostly quick bursts, with the occasional long pause
+        chance = (rng or _rng).random
+        return lambda: uniform(1, 3) if chance() < 0.7 else uniform(30, 90)
+    return partial(uniform, *PATTERN_DELAYS.get(pattern, (MIN_DELAY, MAX_DELAY)))
+
+def get_pattern_delay(pattern: str, chaos: bool = False,
+                      rng: Optional[random.Random] = None) -> float:
+    return pattern_delay_sampler(pattern, chaos, rng)()
+
+FINGERPRINT_BATCH = 64
 
-def build_headers() -> dict:
+@dataclass
+class HeaderSource:
+    """One worker's generator plus its queues of pre-drawn header batches."""
+    rng: random.Random = field(default_factory=random.Random)
+    fingerprints: Deque[tuple] = field(default_factory=deque)
+    options: Deque[tuple] = field(default_factory=deque)
+
+_default_headers = HeaderSource(_rng)
+
+def next_fingerprint_batch(n: int = FINGERPRINT_BATCH,
+                           rng: Optional[random.Random] = None) -> List[tuple]:
+    """Draw n (user agent, accept, language, encoding, referer) tuples at once."""
+    choices = (rng or _rng).choices
+    return list(zip(
+        choices(USER_AGENTS, k=n),
+        choices(ACCEPT_HEADERS, k=n),
+        choices(LANGUAGES, k=n),
+        choices(ENCODINGS, k=n),
+        choices(REFERERS, k=n),
+    ))
+
+def _next_header_options_batch(n: int = FINGERPRINT_BATCH,
+                               rng: Optional[random.Random] = None) -> List[tuple]:
+    """Draw n (connection, dnt, cache control, sec-ch pair, cookie?) tuples at once."""
+    choices = (rng or _rng).choices
+    return list(zip(
+        choices(CONNECTIONS, k=n),
+        choices(DNT_OPTIONS, DNT_WEIGHTS, k=n),
+        choices(CACHE_CONTROL_OPTIONS, CACHE_CONTROL_WEIGHTS, k=n),
+        choices(SEC_CH_OPTIONS, SEC_CH_WEIGHTS, k=n),
+        choices((False, True), (3, 7), k=n),
+    ))
+
+def build_headers(source: Optional[HeaderSource] = None) -> dict:
     """
     Build randomized HTTP headers.
 
     Creates headers so diverse that ad networks will think you're
     simultaneously a Windows user, a Mac enthusiast, a Linux nerd,
     and someone who browses the web on their refrigerator.
+
+    Every draw comes from source's generator, so a seeded worker gets the
+    same headers run after run.
     """
+    source = source or _default_headers
+    rng = source.rng
+    if not source.fingerprints:
+        source.fingerprints.extend(next_fingerprint_batch(rng=rng))
+    user_agent, accept, language, encoding, referer = source.fingerprints.popleft()
     headers = {
-        "User-Agent": random.choice(USER_AGENTS),
-        "Accept": random.choice(ACCEPT_HEADERS),
-        "Accept-Language": random.choice(LANGUAGES),
-        "Accept-Encoding": random.choice(ENCODINGS),
-        "Connection": random.choice(["keep-alive", "close"]),
+        "User-Agent": user_agent,
+        "Accept": accept,
+        "Accept-Language": language,
+        "Accept-Encoding": encoding,
     }
-
-    # Random DNT
-    if random.random() > 0.3:
-        headers["DNT"] = str(random.randint(0, 1))
-
-    # Random referer
-    referer = random.choice(REFERERS)
     if referer:
         headers["Referer"] = referer
 
+    # The per-request extras come pre-drawn in batches too
+    if not source.options:
+        source.options.extend(_next_header_options_batch(rng=rng))
+    connection, dnt, cache_control, sec_ch, cookie = source.options.popleft()
+    headers["Connection"] = connection
+
+    # Random DNT
+    if dnt:
+        headers["DNT"] = dnt
+
     # Random cache control
-    if random.random() > 0.5:
-        headers["Cache-Control"] = random.choice(["max-age=0", "no-cache", "no-store"])
+    if cache_control:
+        headers["Cache-Control"] = cache_control
 
     # Sec-CH-UA headers (modern browsers)
-    if random.random() > 0.5:
-        headers["Sec-CH-UA-Mobile"] = f"?{random.randint(0, 1)}"
-        headers["Sec-CH-UA-Platform"] = f'"{random.choice(PLATFORMS)}"'
+    if sec_ch:
+        headers["Sec-CH-UA-Mobile"], headers["Sec-CH-UA-Platform"] = sec_ch
 
     # Fake cookies
-    if random.random() > 0.3:
-        session_id = generate_session_id()
-        ts = int(datetime.now().timestamp())
-        headers["Cookie"] = f"_ga=GA1.2.{random.randint(1000000, 9999999)}.{ts}; session={session_id}"
+    if cookie:
+        session_id = generate_session_id(rng)
+        ts = int(time.time())
+        headers["Cookie"] = f"_ga=GA1.2.{rng.randint(1000000, 9999999)}.{ts}; session={session_id}"
 
     return headers
 
@@ -310,50 +445,107 @@ def build_headers() -> dict:
 # HEADLINE EXTRACTION
 # ============================================================================
 
+_WHITESPACE_RE = re.compile(r'\s+')
+# Heading tags tried for headlines, in order
+HEADLINE_TAGS = ('h1', 'h2', 'h3')
+# Only headings and <title> (the fallback) get built into the tree
+HEADLINE_STRAINER = SoupStrainer(list(HEADLINE_TAGS) + ['title'])
+# An h1-h3 and its contents, e.g. <h2 class="x">Some headline</h2>
+_HEADING_RE = re.compile(r'<h([1-3])\b[^>]*>(.*?)</h\1\s*>', re.IGNORECASE | re.DOTALL)
+# Comments and blocks whose contents a regex can't judge the way a parser does
+_OPAQUE_BLOCK_RE = re.compile(
+    r'<!--.*?-->|<(script|style|template|noscript)\b.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL,
+)
+_HEADING_TAG_RE = re.compile(r'<h[1-3]\b', re.IGNORECASE)
+
+def _scan_headings(html: str) -> Optional[List[str]]:
+    """
+    Pull plain-text headings straight out of the raw HTML, skipping the parser.
+
+    Returns None unless that alone yields 5 usable headlines. It also
+    returns None, leaving the page to the real parse, when a heading tag
+    sits inside a comment, <script>, <style>, <template> or <noscript>, or
+    when a heading with markup inside (links, spans) comes before a level's
+    fifth heading. Either would make the scan pick different headlines
+    than the parse does.
+    """
+    for block in _OPAQUE_BLOCK_RE.finditer(html):
+        if _HEADING_TAG_RE.search(block.group()):
+            return None
+
+    by_level = {'1': [], '2': [], '3': []}
+    for match in _HEADING_RE.finditer(html):
+        texts = by_level[match.group(1)]
+        if len(texts) < 5:
+            inner = match.group(2)
+            if '<' in inner:
+                return None
+            texts.append(unescape(inner).strip())
+            if all(len(t) == 5 for t in by_level.values()):
+                break
+    headings = by_level['1'] + by_level['2'] + by_level['3']
+    usable = {text for text in (_WHITESPACE_RE.sub(' ', h) for h in headings)
+              if 20 < len(text) < 200}
+    return headings if len(usable) >= 5 else None
+
+def _parse_headings(html: str) -> tuple[List[str], Optional[str]]:
+    """Text of up to 5 of each heading tag, in HEADLINE_TAGS order, and the <title>."""
+    headings = _scan_headings(html)
+    if headings is not None:
+        # Enough headlines, so the <title> fallback won't be needed
+        return headings, None
+
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        headings = [node.text(strip=True)
+                    for tag in HEADLINE_TAGS for node in tree.css(tag)[:5]]
+        title = tree.css_first('title')
+        return headings, title.text(strip=True) if title else None
+
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=HEADLINE_STRAINER)
+    headings = [elem.get_text(strip=True)
+                for tag in HEADLINE_TAGS for elem in soup.find_all(tag, limit=5)]
+    title = soup.find('title')
+    return headings, title.get_text(strip=True) if title else None
+
+@lru_cache(maxsize=256)
+def _url_source(url: str) -> str:
+    """Host part of a URL; the news URLs are a fixed set, so it's cached."""
+    return url.split('/', 3)[2]
+
 def extract_headlines(html: str, url: str, category: str) -> List[dict]:
     headlines = []
     try:
-        soup = BeautifulSoup(html, 'lxml')
-
-        # Try various headline selectors
-        selectors = [
-            'h1', 'h2', 'h3',
-            'article h2', 'article h3',
-            '.headline', '.title',
-            '[class*="headline"]', '[class*="title"]',
-        ]
+        headings, title = _parse_headings(html)
+        # Same for every headline from this page
+        source = _url_source(url)
+        fetched_at = datetime.now().strftime("%H:%M:%S")
 
         seen = set()
-        for selector in selectors:
-            for elem in soup.select(selector)[:5]:
-                text = elem.get_text(strip=True)
-                # Clean and validate
-                text = re.sub(r'\s+', ' ', text)
-                if len(text) > 20 and len(text) < 200 and text not in seen:
-                    seen.add(text)
-                    headlines.append({
-                        "text": text[:120] + "..." if len(text) > 120 else text,
-                        "category": category,
-                        "source": url.split('/')[2],
-                        "time": datetime.now().strftime("%H:%M:%S"),
-                    })
-                    if len(headlines) >= 5:
-                        break
-            if len(headlines) >= 5:
-                break
+        for text in headings:
+            # Clean and validate
+            text = _WHITESPACE_RE.sub(' ', text)
+            n = len(text)
+            if 20 < n < 200 and text not in seen:
+                seen.add(text)
+                headlines.append({
+                    "text": text if n <= 120 else text[:120] + "...",
+                    "category": category,
+                    "source": source,
+                    "time": fetched_at,
+                })
+                if len(headlines) >= 5:
+                    break
 
         # Fallback to title tag
-        if not headlines:
-            title = soup.find('title')
-            if title:
-                text = title.get_text(strip=True)
-                if len(text) > 10:
-                    headlines.append({
-                        "text": text[:120],
-                        "category": category,
-                        "source": url.split('/')[2],
-                        "time": datetime.now().strftime("%H:%M:%S"),
-                    })
+        if not headlines and title and len(title) > 10:
+            headlines.append({
+                "text": title[:120],
+                "category": category,
+                "source": source,
+                "time": fetched_at,
+            })
     except Exception:
         pass
 
@@ -363,19 +555,51 @@ def extract_headlines(html: str, url: str, category: str) -> List[dict]:
 # NETWORK FUNCTIONS
 # ============================================================================
 
-async def fetch_url(client: httpx.AsyncClient, url: str, worker_id: int) -> Optional[str]:
-    headers = build_headers()
+async def _read_capped(chunks, max_bytes: int) -> bytes:
+    """Collect chunks from an async iterator until max_bytes have arrived."""
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        if len(body) >= max_bytes:
+            break
+    return bytes(body[:max_bytes])
+
+async def http_get(client, url: str, headers: dict, follow_redirects: bool = False,
+                   max_bytes: Optional[int] = None) -> str:
+    """GET url with whichever client create_client() made and return the body text.
+
+    With max_bytes, the body is streamed and reading stops at that size.
+    """
+    if AIOHTTP_AVAILABLE:
+        async with client.get(url, headers=headers, allow_redirects=follow_redirects) as response:
+            if max_bytes is None:
+                return await response.text(errors="replace")
+            body = await _read_capped(response.content.iter_chunked(65536), max_bytes)
+            return body.decode(response.charset or "utf-8", errors="replace")
+    if max_bytes is None:
+        response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=follow_redirects)
+        return response.text
+    async with client.stream("GET", url, headers=headers, timeout=30.0,
+                             follow_redirects=follow_redirects) as response:
+        body = await _read_capped(response.aiter_bytes(), max_bytes)
+        return body.decode(response.charset_encoding or "utf-8", errors="replace")
+
+async def fetch_url(client, url: str, worker_id: int,
+                    source: Optional[HeaderSource] = None) -> Optional[str]:
+    headers = build_headers(source)
 
     try:
-        response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+        text = await http_get(client, url, headers, follow_redirects=True,
+                              max_bytes=MAX_PAGE_BYTES)
         state.request_count += 1
-        return response.text
+        return text
     except Exception:
         state.errors += 1
         return None
 
-async def connect_to_vps(client: httpx.AsyncClient, target: str) -> bool:
-    headers = build_headers()
+async def connect_to_vps(client, target: str,
+                         source: Optional[HeaderSource] = None) -> bool:
+    headers = build_headers(source)
 
     # Parse target
     if ':' in target:
@@ -387,7 +611,7 @@ async def connect_to_vps(client: httpx.AsyncClient, target: str) -> bool:
     for scheme in ["https", "http"]:
         try:
             url = f"{scheme}://{host}:{port}"
-            response = await client.get(url, headers=headers, timeout=30.0)
+            await http_get(client, url, headers)
             state.request_count += 1
             return True
         except Exception:
@@ -396,8 +620,8 @@ async def connect_to_vps(client: httpx.AsyncClient, target: str) -> bool:
     # Fallback: raw TCP ping
     try:
         reader, writer = await asyncio.open_connection(host, int(port))
-        writer.write(f"PING_{int(datetime.now().timestamp())}\n".encode())
-        await writer.drain()
+        # close() flushes the write buffer first, so no separate drain()
+        writer.write(f"PING_{int(time.time())}\n".encode())
         writer.close()
         await writer.wait_closed()
         state.request_count += 1
@@ -406,12 +630,17 @@ async def connect_to_vps(client: httpx.AsyncClient, target: str) -> bool:
         state.errors += 1
         return False
 
-def send_local_udp(port: int = 19999):
+# One non-blocking UDP socket, made on first use and shared by all workers
+_udp_sock: Optional[socket.socket] = None
+
+def send_local_udp(port: int = 19999, rng: Optional[random.Random] = None):
+    global _udp_sock
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        message = f"NOISE_{int(datetime.now().timestamp())}_{random.randint(1000, 9999)}"
-        sock.sendto(message.encode(), ("127.0.0.1", port))
-        sock.close()
+        if _udp_sock is None:
+            _udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            _udp_sock.setblocking(False)
+        message = f"NOISE_{int(time.time())}_{(rng or _rng).randint(1000, 9999)}"
+        _udp_sock.sendto(message.encode(), ("127.0.0.1", port))
     except Exception:
         pass
 
@@ -429,6 +658,18 @@ def create_display(config: Config) -> Layout:
         Layout(name="footer", size=3),
     )
 
+    # Footer never changes during a run, so it's drawn once here
+    if config.vps_target:
+        target_text = f"[yellow]VPS Target: {config.vps_target}[/]"
+    else:
+        target_text = "[dim]Browsing news sites[/]"
+
+    footer_text = Text()
+    footer_text.append("Press Ctrl+C to stop | ", style="dim")
+    footer_text.append(target_text)
+
+    layout["footer"].update(Panel(footer_text, box=box.ROUNDED))
+
     return layout
 
 def update_display(layout: Layout, config: Config):
@@ -436,139 +677,142 @@ def update_display(layout: Layout, config: Config):
     elapsed = datetime.now() - state.start_time
     elapsed_str = str(elapsed).split('.')[0]
 
-    mode_text = f"[bold cyan]CHAOS MODE[/]" if config.chaos_mode else f"[cyan]{config.mode.upper()}[/]"
-    header_text = Text()
-    header_text.append("🌐 Traffic Noise Generator ", style="bold green")
-    header_text.append(f"| Mode: {mode_text} ", style="white")
-    header_text.append(f"| Workers: [yellow]{config.parallel_workers}[/] ", style="white")
-    header_text.append(f"| Runtime: [magenta]{elapsed_str}[/]", style="white")
-
-    layout["header"].update(Panel(header_text, box=box.ROUNDED))
-
-    # Headlines
-    headline_table = Table(
-        show_header=True,
-        header_style="bold blue",
-        box=box.SIMPLE,
-        expand=True,
-        padding=(0, 1),
-    )
-    headline_table.add_column("Time", style="dim", width=10)
-    headline_table.add_column("Category", style="cyan", width=12)
-    headline_table.add_column("Headline", style="white", ratio=1)
-    headline_table.add_column("Source", style="dim green", width=25)
-
-    # Get most recent headlines
-    recent = list(state.headlines)[-config.max_headlines:]
-    for h in recent:
-        headline_table.add_row(
-            h.get("time", ""),
-            h.get("category", "")[:10],
-            h.get("text", "")[:80],
-            h.get("source", "")[:23],
+    # Each section is only rebuilt when what it shows has changed
+    if _changed(layout, "header", elapsed_str):
+        mode_text = f"[bold cyan]CHAOS MODE[/]" if config.chaos_mode else f"[cyan]{config.mode.upper()}[/]"
+        header_text = Text()
+        header_text.append("🌐 Traffic Noise Generator ", style="bold green")
+        header_text.append(f"| Mode: {mode_text} ", style="white")
+        header_text.append(f"| Workers: [yellow]{config.parallel_workers}[/] ", style="white")
+        header_text.append(f"| Runtime: [magenta]{elapsed_str}[/]", style="white")
+
+        layout["header"].update(Panel(header_text, box=box.ROUNDED))
+
+    # Headlines: only change when a worker adds one
+    if _changed(layout, "headlines", state.headline_version):
+        headline_table = Table(
+            show_header=True,
+            header_style="bold blue",
+            box=box.SIMPLE,
+            expand=True,
+            padding=(0, 1),
         )
-
-    # Pad with empty rows if needed
-    while len(recent) < config.max_headlines:
-        headline_table.add_row("", "", "[dim]Waiting for headlines...[/]", "")
-        recent.append({})
-
-    layout["headlines"].update(Panel(
-        headline_table,
-        title="[bold]📰 Live Headlines[/]",
-        border_style="blue",
-        box=box.ROUNDED,
-    ))
+        headline_table.add_column("Time", style="dim", width=10)
+        headline_table.add_column("Category", style="cyan", width=12)
+        headline_table.add_column("Headline", style="white", ratio=1)
+        headline_table.add_column("Source", style="dim green", width=25)
+
+        # Most recent headlines, read straight off the deque
+        shown = 0
+        for h in islice(state.headlines, max(0, len(state.headlines) - config.max_headlines), None):
+            headline_table.add_row(
+                h.get("time", ""),
+                h.get("category", "")[:10],
+                h.get("text", "")[:80],
+                h.get("source", "")[:23],
+            )
+            shown += 1
+
+        # Pad with empty rows if needed
+        for _ in range(config.max_headlines - shown):
+            headline_table.add_row("", "", "[dim]Waiting for headlines...[/]", "")
+
+        layout["headlines"].update(Panel(
+            headline_table,
+            title="[bold]📰 Live Headlines[/]",
+            border_style="blue",
+            box=box.ROUNDED,
+        ))
 
     # Stats
-    stats_table = Table(show_header=False, box=None, expand=True, padding=(0, 2))
-    stats_table.add_column("Label", style="dim")
-    stats_table.add_column("Value", style="bold")
-    stats_table.add_column("Label2", style="dim")
-    stats_table.add_column("Value2", style="bold")
-
-    stats_table.add_row(
-        "Requests:", f"[green]{state.request_count}[/]",
-        "Errors:", f"[red]{state.errors}[/]",
-    )
-    stats_table.add_row(
-        "Last Category:", f"[cyan]{state.last_category or 'N/A'}[/]",
-        "Active Workers:", f"[yellow]{state.workers_active}[/]",
-    )
-    stats_table.add_row(
-        "Last URL:", f"[dim]{(state.last_url or 'N/A')[:50]}[/]",
-        "", "",
-    )
-
-    layout["stats"].update(Panel(
-        stats_table,
-        title="[bold]📊 Statistics[/]",
-        border_style="green",
-        box=box.ROUNDED,
-    ))
-
-    # Footer
-    if config.vps_target:
-        target_text = f"[yellow]VPS Target: {config.vps_target}[/]"
-    else:
-        target_text = "[dim]Browsing news sites[/]"
-
-    footer_text = Text()
-    footer_text.append("Press Ctrl+C to stop | ", style="dim")
-    footer_text.append(target_text)
+    if _changed(layout, "stats", (state.request_count, state.errors, state.last_category,
+                          state.workers_active, state.last_url)):
+        stats_table = Table(show_header=False, box=None, expand=True, padding=(0, 2))
+        stats_table.add_column("Label", style="dim")
+        stats_table.add_column("Value", style="bold")
+        stats_table.add_column("Label2", style="dim")
+        stats_table.add_column("Value2", style="bold")
+
+        stats_table.add_row(
+            "Requests:", f"[green]{state.request_count}[/]",
+            "Errors:", f"[red]{state.errors}[/]",
+        )
+        stats_table.add_row(
+            "Last Category:", f"[cyan]{state.last_category or 'N/A'}[/]",
+            "Active Workers:", f"[yellow]{state.workers_active}[/]",
+        )
+        stats_table.add_row(
+            "Last URL:", f"[dim]{(state.last_url or 'N/A')[:50]}[/]",
+            "", "",
+        )
 
-    layout["footer"].update(Panel(footer_text, box=box.ROUNDED))
+        layout["stats"].update(Panel(
+            stats_table,
+            title="[bold]📊 Statistics[/]",
+            border_style="green",
+            box=box.ROUNDED,
+        ))
 
 # ============================================================================
 # WORKER
 # ============================================================================
 
-async def worker(worker_id: int, config: Config, layout: Layout, live: Live):
-    pattern = random.choice(BROWSING_PATTERNS)
+async def visit_vps(client, config: Config, source: HeaderSource, worker_id: int):
+    await connect_to_vps(client, config.vps_target, source)
+    state.last_url = config.vps_target
+    state.last_category = "VPS"
+
+async def visit_news(client, config: Config, source: HeaderSource, worker_id: int):
+    category, url = get_random_news_url(source.rng)
+    state.last_category = category
+    state.last_url = url
+
+    html = await fetch_url(client, url, worker_id, source)
+
+    if html and config.show_headlines:
+        headlines = extract_headlines(html, url, category)
+        for h in headlines[:2]:  # Add up to 2 headlines per fetch
+            state.headlines.append(h)
+        if headlines:
+            state.headline_version += 1
+
+async def worker(worker_id: int, config: Config, client):
+    # Each worker draws from its own generator so workers never share a stream
+    rng = random.Random(
+        derive_worker_seed(config.seed, worker_id) if config.seed is not None else None
+    )
+    # Headers, cookies and UDP noise draw from it too, with their own queues
+    source = HeaderSource(rng)
+    pattern = rng.choice(BROWSING_PATTERNS)
+    sample_delay = pattern_delay_sampler(pattern, config.chaos_mode, rng)
+    # The mode can't change mid-run, so pick what a visit does up front
+    visit = visit_vps if config.mode == "vps" and config.vps_target else visit_news
     state.workers_active += 1
 
-    async with httpx.AsyncClient() as client:
-        while state.running:
-            try:
-                # Local UDP noise occasionally
-                if random.random() < 0.2:
-                    send_local_udp(19999 + worker_id)
-
-                # Fetch content
-                if config.mode == "vps" and config.vps_target:
-                    await connect_to_vps(client, config.vps_target)
-                    state.last_url = config.vps_target
-                    state.last_category = "VPS"
-                else:
-                    category, url = get_random_news_url()
-                    state.last_category = category
-                    state.last_url = url
-
-                    html = await fetch_url(client, url, worker_id)
-
-                    if html and config.show_headlines:
-                        headlines = extract_headlines(html, url, category)
-                        for h in headlines[:2]:  # Add up to 2 headlines per fetch
-                            state.headlines.append(h)
+    while state.running:
+        try:
+            # Local UDP noise occasionally
+            if rng.random() < 0.2:
+                send_local_udp(19999 + worker_id, rng)
 
-                # Update display
-                update_display(layout, config)
-                live.refresh()
+            # Fetch content
+            await visit(client, config, source, worker_id)
 
-                # Delay based on pattern
-                delay = get_pattern_delay(pattern, config.chaos_mode)
+            # Delay based on pattern
+            delay = sample_delay()
 
-                # Chaos mode: occasionally change pattern
-                if config.chaos_mode and random.random() < 0.1:
-                    pattern = random.choice(BROWSING_PATTERNS)
+            # Chaos mode: occasionally change pattern
+            if config.chaos_mode and rng.random() < 0.1:
+                pattern = rng.choice(BROWSING_PATTERNS)
+                sample_delay = pattern_delay_sampler(pattern, config.chaos_mode, rng)
 
-                await asyncio.sleep(delay)
+            await asyncio.sleep(delay)
 
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                state.errors += 1
-                await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            break
+        except Exception:
+            state.errors += 1
+            await asyncio.sleep(5)
 
     state.workers_active -= 1
 
@@ -576,32 +820,59 @@ async def worker(worker_id: int, config: Config, layout: Layout, live: Live):
 # MAIN
 # ============================================================================
 
+def create_client():
+    """One pooled client shared by all workers, so connections get reused.
+
+    An aiohttp.ClientSession if aiohttp is installed, else an httpx.AsyncClient.
+    """
+    if AIOHTTP_AVAILABLE:
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20,
+                                           ttl_dns_cache=DNS_CACHE_TTL),
+            timeout=aiohttp.ClientTimeout(total=30.0, connect=10.0),
+        )
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50,
+                            keepalive_expiry=30),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+    )
+
+async def display_loop(layout: Layout, config: Config, interval: float = 0.5):
+    """Redraw the dashboard at Live's refresh rate, for all workers at once."""
+    while state.running:
+        update_display(layout, config)
+        await asyncio.sleep(interval)
+
 async def main_async(config: Config):
     layout = create_display(config)
 
-    with Live(layout, console=console, refresh_per_second=2, screen=True) as live:
-        update_display(layout, config)
+    async with create_client() as client:
+        with Live(layout, console=console, refresh_per_second=2, screen=True):
+            update_display(layout, config)
 
-        # Create workers
-        tasks = [
-            asyncio.create_task(worker(i, config, layout, live))
-            for i in range(config.parallel_workers)
-        ]
+            # Create workers, plus one task that keeps the display current
+            tasks = [
+                asyncio.create_task(worker(i, config, client))
+                for i in range(config.parallel_workers)
+            ]
+            display = asyncio.create_task(display_loop(layout, config))
 
-        try:
-            if config.duration > 0:
-                await asyncio.sleep(config.duration * 60)
+            try:
+                if config.duration > 0:
+                    await asyncio.sleep(config.duration * 60)
+                    state.running = False
+                else:
+                    # Run until interrupted
+                    await asyncio.gather(*tasks)
+            except asyncio.CancelledError:
+                pass
+            finally:
                 state.running = False
-            else:
-                # Run until interrupted
-                await asyncio.gather(*tasks)
-        except asyncio.CancelledError:
-            pass
-        finally:
-            state.running = False
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
+                for task in tasks:
+                    task.cancel()
+                display.cancel()
+                await asyncio.gather(*tasks, display, return_exceptions=True)
 
 def signal_handler(sig, frame):
     state.running = False
@@ -643,6 +914,8 @@ Examples:
                         help="Minimal output")
     parser.add_argument("--max-headlines", type=int, default=3,
                         help="Max headlines to display (default: 3)")
+    parser.add_argument("--seed", type=str, metavar="NAME",
+                        help="Run name to seed workers from, for reproducible runs")
 
     args = parser.parse_args()
 
@@ -658,6 +931,7 @@ Examples:
         interface=args.interface,
         quiet=args.quiet,
         max_headlines=args.max_headlines,
+        seed=args.seed,
     )
 
     # Setup signal handler
@@ -676,6 +950,8 @@ Examples:
         console.print("[dim]Starting... Press Ctrl+C to stop[/]\n")
 
     # Run
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main_async(config))
     except KeyboardInterrupt: